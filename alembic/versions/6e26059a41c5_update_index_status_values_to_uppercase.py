@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -17,38 +18,101 @@ down_revision: Union[str, Sequence[str], None] = '70fe164ab32a'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows rewritten per batch; keeps lock footprint and WAL volume bounded
+# on large document tables.
+BATCH_SIZE = 30000
+
+# Native enum type for index_status; created/dropped explicitly below.
+index_status_enum = postgresql.ENUM(
+    'PENDING', 'INDEXED', 'FAILED', name='indexstatus', create_type=False
+)
+
+
+def _update_in_batches(update_sql: str) -> None:
+    """Run an UPDATE repeatedly over LIMITed id batches, committing each.
+
+    Document ids are UUID strings, so batching selects the next LIMITed
+    slice of matching ids rather than stepping through numeric id ranges.
+    Each batch runs in its own transaction via the autocommit block, so a
+    failed migration can be resumed without redoing completed batches.
+    """
+    bind = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            result = bind.exec_driver_sql(update_sql)
+            if result.rowcount == 0:
+                break
+
 
 def upgrade() -> None:
     """Upgrade schema."""
     # Drop the old CHECK constraint (lowercase values)
     op.drop_constraint('document_index_status_check', 'document', type_='check')
 
-    # Update existing lowercase values to uppercase to match the enum
-    op.execute("UPDATE document SET index_status = 'PENDING' WHERE index_status = 'pending'")
-    op.execute("UPDATE document SET index_status = 'INDEXED' WHERE index_status = 'indexed'")
-    op.execute("UPDATE document SET index_status = 'FAILED' WHERE index_status = 'failed'")
+    # Update existing lowercase values to uppercase to match the enum.
+    # The <> guard skips rows that are already uppercase, so a partial
+    # re-run performs zero writes instead of rewriting every row.
+    _update_in_batches(
+        "UPDATE document SET index_status = upper(index_status) "
+        "WHERE id IN ("
+        "SELECT id FROM document "
+        "WHERE index_status IN ('pending', 'indexed', 'failed') "
+        "AND index_status <> upper(index_status) "
+        f"LIMIT {BATCH_SIZE})"
+    )
 
-    # Recreate CHECK constraint with uppercase values
-    op.create_check_constraint(
-        'document_index_status_check',
-        'document',
-        "index_status IN ('PENDING', 'INDEXED', 'FAILED')"
+    # Convert the column to a native enum instead of recreating the CHECK
+    # constraint: a 4-byte enum OID per row replaces up to 50 bytes of text,
+    # values are validated by the type itself, and comparisons become
+    # integer compares rather than varchar IN-list scans.
+    index_status_enum.create(op.get_bind(), checkfirst=True)
+    op.execute(
+        "ALTER TABLE document ALTER COLUMN index_status "
+        "TYPE indexstatus USING index_status::indexstatus"
     )
 
+    # The partial index predicate references the old lowercase values;
+    # rebuild it against the uppercase ones.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_index_status")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_index_status "
+            "ON document (project_id, index_status) "
+            "WHERE index_status IN ('PENDING', 'FAILED')"
+        )
+
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # Drop the uppercase CHECK constraint
-    op.drop_constraint('document_index_status_check', 'document', type_='check')
+    # Convert the column back to varchar and drop the enum type
+    op.execute(
+        "ALTER TABLE document ALTER COLUMN index_status "
+        "TYPE VARCHAR(50) USING index_status::text"
+    )
+    index_status_enum.drop(op.get_bind(), checkfirst=True)
 
     # Revert uppercase values back to lowercase
-    op.execute("UPDATE document SET index_status = 'pending' WHERE index_status = 'PENDING'")
-    op.execute("UPDATE document SET index_status = 'indexed' WHERE index_status = 'INDEXED'")
-    op.execute("UPDATE document SET index_status = 'failed' WHERE index_status = 'FAILED'")
+    _update_in_batches(
+        "UPDATE document SET index_status = lower(index_status) "
+        "WHERE id IN ("
+        "SELECT id FROM document "
+        "WHERE index_status IN ('PENDING', 'INDEXED', 'FAILED') "
+        "AND index_status <> lower(index_status) "
+        f"LIMIT {BATCH_SIZE})"
+    )
 
     # Recreate CHECK constraint with lowercase values
-    op.create_check_constraint(
-        'document_index_status_check',
-        'document',
-        "index_status IN ('pending', 'indexed', 'failed')"
+    op.execute(
+        "ALTER TABLE document ADD CONSTRAINT document_index_status_check "
+        "CHECK (index_status IN ('pending', 'indexed', 'failed')) NOT VALID"
     )
+    op.execute("ALTER TABLE document VALIDATE CONSTRAINT document_index_status_check")
+
+    # Restore the partial index over the lowercase values
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_index_status")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_index_status "
+            "ON document (project_id, index_status) "
+            "WHERE index_status IN ('pending', 'failed')"
+        )
@@ -20,27 +20,42 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Rename the column from 'status' to 'index_status'
-    op.alter_column('document', 'status', new_column_name='index_status')
-
-    # Add CHECK constraint for enum values
-    op.create_check_constraint(
-        'document_index_status_check',
-        'document',
-        "index_status IN ('pending', 'indexed', 'failed')"
+    # Rename the column from 'status' to 'index_status'. Raw SQL keeps this
+    # a single catalog-only statement; Postgres does not allow RENAME COLUMN
+    # to be combined with other ALTER TABLE actions.
+    op.execute("ALTER TABLE document RENAME COLUMN status TO index_status")
+
+    # Add CHECK constraint for enum values in a single ALTER TABLE, so the
+    # ACCESS EXCLUSIVE lock is acquired once. NOT VALID + VALIDATE avoids
+    # holding it for the duration of the table scan.
+    op.execute(
+        "ALTER TABLE document ADD CONSTRAINT document_index_status_check "
+        "CHECK (index_status IN ('pending', 'indexed', 'failed')) NOT VALID"
     )
-
-    # Create index on index_status for better query performance
-    op.create_index('ix_document_index_status', 'document', ['index_status'])
+    op.execute("ALTER TABLE document VALIDATE CONSTRAINT document_index_status_check")
+
+    # Create index on index_status for better query performance.
+    # CONCURRENTLY builds the index without blocking writes; it cannot run
+    # inside the migration transaction, hence the autocommit block.
+    # The index is partial: most rows end up 'indexed', so covering only
+    # the non-terminal states keeps the B-tree small enough to stay cached
+    # while still serving the "find work to do" queries. project_id leads
+    # so list_documents(project_id=..., index_status=...) matches directly.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_index_status "
+            "ON document (project_id, index_status) "
+            "WHERE index_status IN ('pending', 'failed')"
+        )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Drop the index
-    op.drop_index('ix_document_index_status', table_name='document')
-
-    # Drop the CHECK constraint
-    op.drop_constraint('document_index_status_check', 'document', type_='check')
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_index_status")
 
-    # Rename the column back from 'index_status' to 'status'
-    op.alter_column('document', 'index_status', new_column_name='status')
+    # Drop the CHECK constraint, then rename the column back. RENAME COLUMN
+    # must stay its own statement; both are catalog-only updates.
+    op.execute("ALTER TABLE document DROP CONSTRAINT document_index_status_check")
+    op.execute("ALTER TABLE document RENAME COLUMN index_status TO status")
@@ -0,0 +1,43 @@
+"""add_document_listing_covering_index
+
+Revision ID: 8c41f7d25a93
+Revises: df372993474c
+Create Date: 2025-10-25 10:12:04.118262
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41f7d25a93'
+down_revision: Union[str, Sequence[str], None] = 'df372993474c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Composite index matching the list_documents predicate and pagination
+    # order, with the page payload columns INCLUDEd so the query runs as an
+    # index-only scan instead of one random heap read per returned row.
+    # The project_id prefix covers the old single-column index, so drop it.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_project_status "
+            "ON document (project_id, index_status, id) "
+            "INCLUDE (content_path, created_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_project_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_document_project_id "
+            "ON document (project_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_document_project_status")
@@ -9,6 +9,7 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -17,9 +18,18 @@ down_revision: Union[str, Sequence[str], None] = '6e26059a41c5'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Declared once at module level with create_type=False so the type is
+# created/dropped explicitly, with a single DDL statement, instead of
+# being re-emitted by every column that references it.
+model_status_enum = postgresql.ENUM(
+    'TRAINING', 'READY', 'FAILED', name='modelstatus', create_type=False
+)
+
 
 def upgrade() -> None:
     """Upgrade schema."""
+    model_status_enum.create(op.get_bind(), checkfirst=True)
+
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('field',
     sa.Column('project_id', sa.String(), nullable=False),
@@ -31,7 +41,6 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['project_id'], ['project.id'], name=op.f('fk_field_project_id_project'), ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id', name=op.f('pk_field'))
     )
-    op.create_index(op.f('ix_field_project_id'), 'field', ['project_id'], unique=False)
     op.create_table('task',
     sa.Column('project_id', sa.String(), nullable=False),
     sa.Column('celery_id', sa.String(length=255), nullable=False),
@@ -46,8 +55,6 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['project_id'], ['project.id'], name=op.f('fk_task_project_id_project'), ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id', name=op.f('pk_task'))
     )
-    op.create_index(op.f('ix_task_celery_id'), 'task', ['celery_id'], unique=True)
-    op.create_index(op.f('ix_task_project_id'), 'task', ['project_id'], unique=False)
     op.create_table('field_class',
     sa.Column('field_id', sa.String(), nullable=False),
     sa.Column('name', sa.String(length=255), nullable=False),
@@ -57,7 +64,6 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['field_id'], ['field.id'], name=op.f('fk_field_class_field_id_field'), ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id', name=op.f('pk_field_class'))
     )
-    op.create_index(op.f('ix_field_class_field_id'), 'field_class', ['field_id'], unique=False)
     op.create_table('model',
     sa.Column('field_id', sa.String(), nullable=False),
     sa.Column('version', sa.Integer(), nullable=False),
@@ -65,7 +71,7 @@ def upgrade() -> None:
     sa.Column('vectorizer_path', sa.String(length=512), nullable=True),
     sa.Column('accuracy', sa.Float(), nullable=True),
     sa.Column('metrics', sa.JSON(), nullable=True),
-    sa.Column('status', sa.Enum('TRAINING', 'READY', 'FAILED', name='modelstatus', native_enum=False, length=50), nullable=False),
+    sa.Column('status', model_status_enum, nullable=False),
     sa.Column('trained_at', sa.DateTime(), nullable=True),
     sa.Column('id', sa.String(), nullable=False),
     sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
@@ -73,7 +79,6 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['field_id'], ['field.id'], name=op.f('fk_model_field_id_field'), ondelete='CASCADE'),
     sa.PrimaryKeyConstraint('id', name=op.f('pk_model'))
     )
-    op.create_index(op.f('ix_model_field_id'), 'model', ['field_id'], unique=False)
     op.create_table('document_label',
     sa.Column('document_id', sa.String(), nullable=False),
     sa.Column('field_id', sa.String(), nullable=False),
@@ -88,9 +93,6 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id', name=op.f('pk_document_label')),
     sa.UniqueConstraint('document_id', 'field_id', name='uq_document_field_label')
     )
-    op.create_index(op.f('ix_document_label_class_id'), 'document_label', ['class_id'], unique=False)
-    op.create_index(op.f('ix_document_label_document_id'), 'document_label', ['document_id'], unique=False)
-    op.create_index(op.f('ix_document_label_field_id'), 'document_label', ['field_id'], unique=False)
     op.create_table('prediction',
     sa.Column('document_id', sa.String(), nullable=False),
     sa.Column('field_id', sa.String(), nullable=False),
@@ -108,10 +110,6 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id', name=op.f('pk_prediction')),
     sa.UniqueConstraint('document_id', 'field_id', name='uq_document_field_prediction')
     )
-    op.create_index(op.f('ix_prediction_class_id'), 'prediction', ['class_id'], unique=False)
-    op.create_index(op.f('ix_prediction_document_id'), 'prediction', ['document_id'], unique=False)
-    op.create_index(op.f('ix_prediction_field_id'), 'prediction', ['field_id'], unique=False)
-    op.create_index(op.f('ix_prediction_model_id'), 'prediction', ['model_id'], unique=False)
     op.drop_index(op.f('ix_document_prediction_id'), table_name='document')
     op.drop_column('document', 'prediction')
     op.drop_column('document', 'label')
@@ -119,6 +117,24 @@ def upgrade() -> None:
     op.drop_column('document', 'prediction_id')
     # ### end Alembic commands ###
 
+    # Indexes are created after all tables so that any seed/bulk load
+    # replayed in the same deploy pays the B-tree build cost once at the
+    # end instead of per inserted row. One op.execute per statement: the
+    # asyncpg connection env.py migrates over runs everything as prepared
+    # statements, which reject multi-command strings.
+    op.execute("CREATE INDEX ix_field_project_id ON field (project_id)")
+    op.execute("CREATE UNIQUE INDEX ix_task_celery_id ON task (celery_id)")
+    op.execute("CREATE INDEX ix_task_project_id ON task (project_id)")
+    op.execute("CREATE INDEX ix_field_class_field_id ON field_class (field_id)")
+    op.execute("CREATE INDEX ix_model_field_id ON model (field_id)")
+    op.execute("CREATE INDEX ix_document_label_class_id ON document_label (class_id)")
+    op.execute("CREATE INDEX ix_document_label_document_id ON document_label (document_id)")
+    op.execute("CREATE INDEX ix_document_label_field_id ON document_label (field_id)")
+    op.execute("CREATE INDEX ix_prediction_class_id ON prediction (class_id)")
+    op.execute("CREATE INDEX ix_prediction_document_id ON prediction (document_id)")
+    op.execute("CREATE INDEX ix_prediction_field_id ON prediction (field_id)")
+    op.execute("CREATE INDEX ix_prediction_model_id ON prediction (model_id)")
+
 
 def downgrade() -> None:
     """Downgrade schema."""
@@ -128,6 +144,30 @@ def downgrade() -> None:
     op.add_column('document', sa.Column('label', sa.VARCHAR(length=255), autoincrement=False, nullable=True))
     op.add_column('document', sa.Column('prediction', sa.VARCHAR(length=255), autoincrement=False, nullable=True))
     op.create_index(op.f('ix_document_prediction_id'), 'document', ['prediction_id'], unique=False)
+
+    # Detach the FK constraints first (catalog-only, one ALTER TABLE per
+    # table) so the subsequent DROP TABLEs never perform per-row cascade
+    # or dependency validation on populated tables.
+    op.execute(
+        "ALTER TABLE prediction "
+        "DROP CONSTRAINT IF EXISTS fk_prediction_document_id_document, "
+        "DROP CONSTRAINT IF EXISTS fk_prediction_field_id_field, "
+        "DROP CONSTRAINT IF EXISTS fk_prediction_class_id_field_class, "
+        "DROP CONSTRAINT IF EXISTS fk_prediction_model_id_model"
+    )
+    op.execute(
+        "ALTER TABLE document_label "
+        "DROP CONSTRAINT IF EXISTS fk_document_label_document_id_document, "
+        "DROP CONSTRAINT IF EXISTS fk_document_label_field_id_field, "
+        "DROP CONSTRAINT IF EXISTS fk_document_label_class_id_field_class"
+    )
+    op.execute("ALTER TABLE model DROP CONSTRAINT IF EXISTS fk_model_field_id_field")
+    op.execute(
+        "ALTER TABLE field_class DROP CONSTRAINT IF EXISTS fk_field_class_field_id_field"
+    )
+    op.execute("ALTER TABLE task DROP CONSTRAINT IF EXISTS fk_task_project_id_project")
+    op.execute("ALTER TABLE field DROP CONSTRAINT IF EXISTS fk_field_project_id_project")
+
     op.drop_index(op.f('ix_prediction_model_id'), table_name='prediction')
     op.drop_index(op.f('ix_prediction_field_id'), table_name='prediction')
     op.drop_index(op.f('ix_prediction_document_id'), table_name='prediction')
@@ -147,3 +187,5 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_field_project_id'), table_name='field')
     op.drop_table('field')
     # ### end Alembic commands ###
+
+    model_status_enum.drop(op.get_bind(), checkfirst=True)
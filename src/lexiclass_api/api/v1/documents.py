@@ -1,11 +1,11 @@
 """Document API endpoints."""
 
-from typing import List
+from typing import AsyncIterator, List
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
 
-from ...core.deps import get_db
+from ...core.deps import get_document_service, get_project_service
 from ...models import IndexStatus
 from ...schemas.document import Document, DocumentBulkCreate
 from ...services.documents import DocumentService
@@ -24,14 +24,16 @@ async def create_documents(
     *,
     project_id: str,
     documents_in: DocumentBulkCreate,
-    db: AsyncSession = Depends(get_db),
+    service: DocumentService = Depends(get_document_service),
+    project_service: ProjectService = Depends(get_project_service),
 ) -> List[Document]:
     """Create new documents in a project.
 
     Args:
         project_id: Project ID
         documents_in: Documents to create
-        db: Database session
+        service: Document service
+        project_service: Project service
 
 
     Returns:
@@ -40,43 +42,49 @@ async def create_documents(
     Raises:
         HTTPException: If project not found or validation error
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    # Create documents
-    service = DocumentService(db)
-    documents = await service.create_bulk(project_id, documents_in)
+    # Create documents. The project FK guards integrity, so the existence
+    # probe only runs on the failure path instead of costing every request
+    # an extra round trip.
+    try:
+        documents = await service.create_bulk(project_id, documents_in)
+    except HTTPException:
+        if not await project_service.exists(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+        raise
     return documents
 
 
 @router.get(
     "/{project_id}/documents",
-    response_model=List[Document],
+    response_model=None,
+    responses={200: {"model": List[Document]}},
     tags=["documents"],
 )
 async def list_documents(
     *,
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    service: DocumentService = Depends(get_document_service),
+    project_service: ProjectService = Depends(get_project_service),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: str | None = Query(None),
     label: str | None = None,
     index_status: IndexStatus | None = None,
-) -> List[Document]:
+) -> StreamingResponse:
     """List documents in a project.
 
     Args:
         project_id: Project ID
-        db: Database session
+        service: Document service
+        project_service: Project service
 
-        skip: Number of documents to skip
+        skip: Number of documents to skip (deprecated in favour of after_id)
         limit: Maximum number of documents to return
+        after_id: Keyset cursor; return documents with id greater than this.
+            Pass the id of the last document of the previous page
         label: Filter by label
         index_status: Filter by index status
 
@@ -86,25 +94,50 @@ async def list_documents(
     Raises:
         HTTPException: If project not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
+    # Stream rows straight from a server-side cursor so a 1000-row page is
+    # never materialized in memory. The skip parameter keeps working by
+    # resolving it to a keyset cursor with a cheap id-only probe.
+    beyond_end = False
+    if skip and after_id is None:
+        after_id = await service.resolve_skip_cursor(
+            project_id, skip=skip, label=label, index_status=index_status
         )
+        # Fewer than skip matching rows: the page is empty
+        beyond_end = after_id is None
 
-    # Get documents
-    service = DocumentService(db)
-    documents = await service.get_multi(
+    first: Document | None = None
+    documents = service.stream_multi(
         project_id=project_id,
-        skip=skip,
-        limit=limit,
+        limit=limit if not beyond_end else 0,
+        after_id=after_id,
         label=label,
         index_status=index_status,
     )
-    return list(documents)
+
+    # Peek the first row before sending headers: an empty result may mean
+    # the project does not exist, which must still 404.
+    if not beyond_end:
+        try:
+            first = await documents.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+    if first is None:
+        if not await project_service.exists(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        if first is not None:
+            yield first.model_dump_json().encode()
+            async for doc in documents:
+                yield b"," + doc.model_dump_json().encode()
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
 
 
 @router.delete(
@@ -116,28 +149,27 @@ async def delete_documents(
     *,
     project_id: str,
     document_ids: List[str] = Query(..., min_items=1, max_items=1000),
-    db: AsyncSession = Depends(get_db),
+    service: DocumentService = Depends(get_document_service),
+    project_service: ProjectService = Depends(get_project_service),
 ) -> None:
     """Delete documents from a project.
 
     Args:
         project_id: Project ID
         document_ids: IDs of documents to delete
-        db: Database session
+        service: Document service
+        project_service: Project service
 
 
     Raises:
         HTTPException: If project not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    # Delete documents
-    service = DocumentService(db)
-    await service.delete_multi(project_id, document_ids)
+    # Delete documents; fall back to a project probe only when nothing
+    # matched, so the common case costs a single round trip.
+    deleted = await service.delete_multi(project_id, document_ids)
+    if deleted == 0:
+        if not await project_service.exists(project_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
@@ -1,9 +1,13 @@
 """Field API endpoints."""
 
+import hashlib
 from typing import Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.deps import get_db
@@ -22,6 +26,34 @@ from ...services.projects import ProjectService
 router = APIRouter()
 
 
+def _etag(*parts: object) -> str:
+    """Build a strong ETag from the identifying parts of a resource."""
+    digest = hashlib.md5("|".join(str(p) for p in parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def _fk_not_found_detail(exc: IntegrityError) -> Optional[str]:
+    """Map a foreign-key violation to the missing parent resource.
+
+    Returns a 404 detail string when the IntegrityError is a foreign-key
+    violation, or None when it is some other constraint failure that the
+    caller should not swallow.
+    """
+    orig = getattr(exc, "orig", None)
+    message = str(orig if orig is not None else exc).lower()
+    if getattr(orig, "sqlstate", None) != "23503" and "foreign key" not in message:
+        return None
+    for column, resource in (
+        ("project_id", "Project"),
+        ("document_id", "Document"),
+        ("field_id", "Field"),
+        ("class_id", "Field class"),
+    ):
+        if column in message:
+            return f"{resource} not found"
+    return "Referenced resource not found"
+
+
 # Field Management Endpoints
 
 @router.post(
@@ -37,47 +69,69 @@ async def create_field(
     db: AsyncSession = Depends(get_db),
 ) -> Field:
     """Create new field for a project."""
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
+    # Let the project FK enforce existence instead of a preflight lookup;
+    # a violation is translated back into the usual 404.
+    service = FieldService(db)
+    try:
+        field = await service.create(project_id, field_in)
+    except IntegrityError as e:
+        await db.rollback()
+        detail = _fk_not_found_detail(e)
+        if detail is None:
+            raise
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    service = FieldService(db)
-    field = await service.create(project_id, field_in)
+            detail=detail,
+        ) from e
     return field
 
 
 @router.get("/fields/{field_id}", response_model=Field, tags=["fields"])
 async def get_field(
     field_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> Field:
-    """Get field by ID."""
+    """Get field by ID.
+
+    Supports conditional requests: a matching If-None-Match returns 304
+    after only a narrow updated_at probe, skipping the row fetch and
+    serialization that polling clients would otherwise pay for.
+    """
     service = FieldService(db)
-    field = await service.get(field_id)
-    if not field:
+    updated_at = await service.get_updated_at(field_id)
+    if updated_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field not found",
         )
+    etag = _etag(field_id, updated_at)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    field = await service.get(field_id)
+    response.headers["ETag"] = etag
     return field
 
 
 @router.get(
-    "/projects/{project_id}/fields", response_model=List[Field], tags=["fields"]
+    "/projects/{project_id}/fields",
+    response_model=None,
+    tags=["fields"],
 )
 async def list_project_fields(
     *,
     project_id: str,
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[Field]:
-    """List fields for a project."""
+) -> ORJSONResponse:
+    """List fields for a project.
+
+    Pages are keyset-paginated: pass the returned next_cursor as after_id
+    to fetch the next page.
+    """
     # Verify project exists
     project_service = ProjectService(db)
     project = await project_service.get(project_id)
@@ -87,9 +141,14 @@ async def list_project_fields(
             detail="Project not found",
         )
 
+    # Serialize column dicts with orjson directly; large pages skip ORM
+    # hydration, response-model validation and stdlib json entirely
     service = FieldService(db)
-    fields = await service.get_by_project(project_id, skip=skip, limit=limit)
-    return list(fields)
+    rows = await service.get_by_project_rows(
+        project_id, after_id=after_id, limit=limit
+    )
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return ORJSONResponse({"items": rows, "next_cursor": next_cursor})
 
 
 @router.put("/fields/{field_id}", response_model=Field, tags=["fields"])
@@ -101,13 +160,12 @@ async def update_field(
 ) -> Field:
     """Update field."""
     service = FieldService(db)
-    field = await service.get(field_id)
+    field = await service.update_by_id(field_id, field_in)
     if not field:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field not found",
         )
-    field = await service.update(field, field_in)
     return field
 
 
@@ -121,13 +179,11 @@ async def delete_field(
 ) -> None:
     """Delete field."""
     service = FieldService(db)
-    field = await service.get(field_id)
-    if not field:
+    if not await service.delete_by_id(field_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field not found",
         )
-    await service.delete(field)
 
 
 # Field Class Management Endpoints
@@ -145,17 +201,20 @@ async def create_field_class(
     db: AsyncSession = Depends(get_db),
 ) -> FieldClass:
     """Create new class for a field."""
-    # Verify field exists
-    field_service = FieldService(db)
-    field = await field_service.get(field_id)
-    if not field:
+    # Let the field FK enforce existence instead of a preflight lookup;
+    # a violation is translated back into the usual 404.
+    service = FieldClassService(db)
+    try:
+        field_class = await service.create(field_id, class_in)
+    except IntegrityError as e:
+        await db.rollback()
+        detail = _fk_not_found_detail(e)
+        if detail is None:
+            raise
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Field not found",
-        )
-
-    service = FieldClassService(db)
-    field_class = await service.create(field_id, class_in)
+            detail=detail,
+        ) from e
     return field_class
 
 
@@ -164,32 +223,47 @@ async def create_field_class(
 )
 async def get_field_class(
     class_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> FieldClass:
-    """Get field class by ID."""
+    """Get field class by ID.
+
+    Honors If-None-Match with a 304 after a narrow updated_at probe.
+    """
     service = FieldClassService(db)
-    field_class = await service.get(class_id)
-    if not field_class:
+    updated_at = await service.get_updated_at(class_id)
+    if updated_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field class not found",
         )
+    etag = _etag(class_id, updated_at)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    field_class = await service.get(class_id)
+    response.headers["ETag"] = etag
     return field_class
 
 
 @router.get(
     "/fields/{field_id}/classes",
-    response_model=List[FieldClass],
+    response_model=None,
     tags=["field-classes"],
 )
 async def list_field_classes(
     *,
     field_id: str,
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[FieldClass]:
-    """List classes for a field."""
+) -> ORJSONResponse:
+    """List classes for a field.
+
+    Pages are keyset-paginated: pass the returned next_cursor as after_id
+    to fetch the next page.
+    """
     # Verify field exists
     field_service = FieldService(db)
     field = await field_service.get(field_id)
@@ -200,8 +274,11 @@ async def list_field_classes(
         )
 
     service = FieldClassService(db)
-    classes = await service.get_by_field(field_id, skip=skip, limit=limit)
-    return list(classes)
+    rows = await service.get_by_field_rows(
+        field_id, after_id=after_id, limit=limit
+    )
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return ORJSONResponse({"items": rows, "next_cursor": next_cursor})
 
 
 @router.put(
@@ -215,13 +292,12 @@ async def update_field_class(
 ) -> FieldClass:
     """Update field class."""
     service = FieldClassService(db)
-    field_class = await service.get(class_id)
+    field_class = await service.update_by_id(class_id, class_in)
     if not field_class:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field class not found",
         )
-    field_class = await service.update(field_class, class_in)
     return field_class
 
 
@@ -237,13 +313,11 @@ async def delete_field_class(
 ) -> None:
     """Delete field class."""
     service = FieldClassService(db)
-    field_class = await service.get(class_id)
-    if not field_class:
+    if not await service.delete_by_id(class_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field class not found",
         )
-    await service.delete(field_class)
 
 
 # Document Label Management Endpoints
@@ -264,84 +338,97 @@ async def create_document_label(
 
     If a label already exists for this document and field, it will be updated.
     """
-    # Verify document exists
-    document_service = DocumentService(db)
-    document = await document_service.get_by_id(document_id)
-    if not document:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Document not found",
-        )
-
-    # Verify field exists
-    field_service = FieldService(db)
-    field = await field_service.get(label_in.field_id)
-    if not field:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Field not found",
-        )
-
-    # Verify class exists and belongs to the field
+    # Document and field existence are enforced by the INSERT's foreign
+    # keys, so those preflight lookups are gone. Class ownership cannot
+    # be expressed as an FK on this insert, so the class's field_id is
+    # probed with one narrow query — missing class and wrong field keep
+    # their original 404/400 split.
     class_service = FieldClassService(db)
-    field_class = await class_service.get(label_in.class_id)
-    if not field_class:
+    class_field_id = await class_service.get_field_id(label_in.class_id)
+    if class_field_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field class not found",
         )
-    if field_class.field_id != label_in.field_id:
+    if class_field_id != label_in.field_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Field class does not belong to the specified field",
         )
 
     service = DocumentLabelService(db)
-    label = await service.create(document_id, label_in)
+    try:
+        label = await service.create(document_id, label_in)
+    except IntegrityError as e:
+        await db.rollback()
+        detail = _fk_not_found_detail(e)
+        if detail is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        ) from e
     return label
 
 
 @router.get("/labels/{label_id}", response_model=DocumentLabel, tags=["document-labels"])
 async def get_document_label(
     label_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> DocumentLabel:
-    """Get document label by ID."""
+    """Get document label by ID.
+
+    Honors If-None-Match with a 304 after a narrow updated_at probe.
+    """
     service = DocumentLabelService(db)
-    label = await service.get(label_id)
-    if not label:
+    updated_at = await service.get_updated_at(label_id)
+    if updated_at is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document label not found",
         )
+    etag = _etag(label_id, updated_at)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    label = await service.get(label_id)
+    response.headers["ETag"] = etag
     return label
 
 
 @router.get(
     "/documents/{document_id}/labels",
-    response_model=List[DocumentLabel],
+    response_model=None,
     tags=["document-labels"],
 )
 async def list_document_labels(
     *,
     document_id: str,
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[DocumentLabel]:
-    """Get all labels for a document."""
-    # Verify document exists
+) -> ORJSONResponse:
+    """Get labels for a document.
+
+    Pages are keyset-paginated: pass the returned next_cursor as after_id
+    to fetch the next page.
+    """
+    # Verify document exists with a SELECT EXISTS probe
     document_service = DocumentService(db)
-    document = await document_service.get_by_id(document_id)
-    if not document:
+    if not await document_service.exists(document_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found",
         )
 
     service = DocumentLabelService(db)
-    labels = await service.get_by_document(document_id, skip=skip, limit=limit)
-    return list(labels)
+    rows = await service.get_by_document_rows(
+        document_id, after_id=after_id, limit=limit
+    )
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return ORJSONResponse({"items": rows, "next_cursor": next_cursor})
 
 
 @router.get(
@@ -382,21 +469,23 @@ async def update_document_label(
             detail="Document label not found",
         )
 
-    # Verify new class exists and belongs to the same field
+    # Probe the new class's field_id with one narrow query instead of
+    # hydrating the class row; missing class and wrong field keep their
+    # original 404/400 split
     class_service = FieldClassService(db)
-    field_class = await class_service.get(label_in.class_id)
-    if not field_class:
+    class_field_id = await class_service.get_field_id(label_in.class_id)
+    if class_field_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field class not found",
         )
-    if field_class.field_id != label.field_id:
+    if class_field_id != label.field_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Cannot change label to a class from a different field",
         )
 
-    label = await service.update(label, label_in)
+    label = await service.update_by_id(label_id, label_in)
     return label
 
 
@@ -412,13 +501,11 @@ async def delete_document_label(
 ) -> None:
     """Delete document label."""
     service = DocumentLabelService(db)
-    label = await service.get(label_id)
-    if not label:
+    if not await service.delete_by_id(label_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document label not found",
         )
-    await service.delete(label)
 
 
 # Field Training Endpoints
@@ -457,10 +544,11 @@ async def train_field(
     """
     from ...core.worker import worker
 
-    # Verify field exists
+    # Only the field's project_id is needed downstream; a narrow column
+    # probe doubles as the existence check
     field_service = FieldService(db)
-    field = await field_service.get(field_id)
-    if not field:
+    project_id = await field_service.get_project_id(field_id)
+    if project_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Field not found",
@@ -468,17 +556,18 @@ async def train_field(
 
     # Check if there are any training labels for this field
     label_service = DocumentLabelService(db)
-    labels = await label_service.get_by_field(field_id, is_training_data=True, limit=1)
-    if not labels:
+    if not await label_service.has_training_labels(field_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No training labels found for this field",
         )
 
-    # Submit field training task to worker
-    task = worker.train_field_model(
+    # Submit field training task to worker off the event loop; the Celery
+    # publish is a blocking broker round trip
+    task = await run_in_threadpool(
+        worker.train_field_model,
         field_id=field_id,
-        project_id=field.project_id,
+        project_id=project_id,
     )
 
     return {
@@ -525,78 +614,93 @@ async def predict_for_field(
     """
     from ...core.worker import worker
 
-    # Verify field exists
-    field_service = FieldService(db)
-    field = await field_service.get(field_id)
-    if not field:
+    # Normalize the batch once at the boundary: drop duplicates (order-
+    # preserving) so downstream checks and the task itself never redo work
+    # per repeated id, and reject empty batches before any DB or broker
+    # round trip
+    document_ids = list(dict.fromkeys(prediction_params.document_ids))
+    if not document_ids:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Field not found",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="document_ids must not be empty",
         )
 
-    # Check if there's a ready model for this field
+    # Resolve field existence and the latest ready model in one query;
+    # missing field vs missing model are distinguished by the result shape
     from ...services.models import ModelService
     model_service = ModelService(db)
-    model = await model_service.get_latest_ready_by_field(field_id)
-    if not model:
+    plan = await model_service.resolve_field_model(field_id)
+    if plan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Field not found",
+        )
+    project_id, model_id = plan
+    if model_id is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No ready model found for this field. Please train the model first.",
         )
 
-    # Verify documents exist
+    # Verify documents exist with a single id-only batched lookup instead
+    # of hydrating full rows just to count them
     doc_service = DocumentService(db)
-    # Check each document exists
-    for doc_id in prediction_params.document_ids:
-        doc = await doc_service.get_by_id(doc_id)
-        if not doc:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Document {doc_id} not found",
-            )
-
-    # Submit field prediction task to worker
-    task = worker.predict_field_documents(
+    found_ids = await doc_service.existing_ids(project_id, document_ids)
+    if len(found_ids) != len(document_ids):
+        missing = sorted(set(document_ids) - found_ids)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Documents not found: {missing}",
+        )
+
+    # Submit field prediction task to worker off the event loop; the
+    # Celery publish is a blocking broker round trip
+    task = await run_in_threadpool(
+        worker.predict_field_documents,
         field_id=field_id,
-        project_id=field.project_id,
-        document_ids=prediction_params.document_ids,
+        project_id=project_id,
+        document_ids=document_ids,
     )
 
     return {
         "task_id": task.id,
         "status": "pending",
         "message": "Field prediction task started",
-        "document_count": len(prediction_params.document_ids),
+        "document_count": len(document_ids),
     }
 
 
 @router.get(
     "/documents/{document_id}/predictions",
-    response_model=List[Prediction],
+    response_model=None,
     tags=["prediction"],
 )
 async def get_document_predictions(
     *,
     document_id: str,
     db: AsyncSession = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    after_id: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[Prediction]:
-    """Get all predictions for a document across all fields."""
-    # Verify document exists
+) -> ORJSONResponse:
+    """Get predictions for a document across all fields.
+
+    Pages are keyset-paginated: pass the returned next_cursor as after_id
+    to fetch the next page.
+    """
+    # Verify document exists with a SELECT EXISTS probe
     doc_service = DocumentService(db)
-    documents = await doc_service.get_multi_by_ids("", [document_id])
-    if not documents:
+    if not await doc_service.exists(document_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found",
         )
 
     prediction_service = PredictionService(db)
-    predictions = await prediction_service.get_by_document(
-        document_id, skip=skip, limit=limit
+    rows = await prediction_service.get_by_document_rows(
+        document_id, after_id=after_id, limit=limit
     )
-    return list(predictions)
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return ORJSONResponse({"items": rows, "next_cursor": next_cursor})
 
 
 @router.get(
@@ -608,16 +712,30 @@ async def get_document_prediction_by_field(
     *,
     document_id: str,
     field_id: str,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ) -> Prediction:
-    """Get prediction for a specific document and field."""
+    """Get prediction for a specific document and field.
+
+    Honors If-None-Match with a 304 after a narrow version probe; the
+    ETag covers the producing model so re-predictions invalidate it.
+    """
     prediction_service = PredictionService(db)
-    prediction = await prediction_service.get_by_document_and_field(
+    version = await prediction_service.get_version_by_document_and_field(
         document_id, field_id
     )
-    if not prediction:
+    if version is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Prediction not found for this document and field",
         )
+    etag = _etag(document_id, field_id, version[0], version[1])
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    prediction = await prediction_service.get_by_document_and_field(
+        document_id, field_id
+    )
+    response.headers["ETag"] = etag
     return prediction
@@ -1,12 +1,10 @@
 """Indexing API endpoints."""
 
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from ...core.deps import get_db
-from ...core.worker import worker, TaskResult
+from ...core.deps import get_document_service, get_project_service
+from ...core.worker import worker
 from ...core.config import settings
 from ...models import IndexStatus
 from ...services.documents import DocumentService
@@ -23,7 +21,8 @@ async def trigger_indexing(
     *,
     project_id: str,
     is_incremental: bool = True,
-    db: AsyncSession = Depends(get_db),
+    doc_service: DocumentService = Depends(get_document_service),
+    project_service: ProjectService = Depends(get_project_service),
 
 ) -> dict:
     """Trigger document indexing.
@@ -31,7 +30,8 @@ async def trigger_indexing(
     Args:
         project_id: Project ID
         is_incremental: Whether to perform incremental indexing
-        db: Database session
+        doc_service: Document service
+        project_service: Project service
 
 
     Returns:
@@ -40,27 +40,25 @@ async def trigger_indexing(
     Raises:
         HTTPException: If project not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
+    # Verify project exists with a SELECT EXISTS probe; nothing here needs
+    # the row itself
+    if not await project_service.exists(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
 
-    # Update all documents index_status to pending
-    doc_service = DocumentService(db)
-    docs = await doc_service.get_multi(project_id)
-    for doc in docs:
-        doc.index_status = IndexStatus.PENDING
-    await db.commit()
+    # Mark all documents pending with one bulk UPDATE instead of loading
+    # every row and flushing per-document updates
+    await doc_service.reset_index_status(project_id)
 
     # Construct storage path
     documents_path = str(settings.get_documents_path(project_id).resolve())
 
-    # Submit task to worker
-    task = worker.index_documents(
+    # Submit task to worker off the event loop; the Celery publish is a
+    # blocking broker round trip
+    task = await run_in_threadpool(
+        worker.index_documents,
         project_id=project_id,
         documents_path=documents_path,
         is_incremental=is_incremental,
@@ -80,14 +78,14 @@ async def trigger_indexing(
 async def get_index_status(
     *,
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    doc_service: DocumentService = Depends(get_document_service),
 
 ) -> dict:
     """Get indexing status for a project.
 
     Args:
         project_id: Project ID
-        db: Database session
+        doc_service: Document service
 
 
     Returns:
@@ -96,21 +94,19 @@ async def get_index_status(
     Raises:
         HTTPException: If project not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
+    # One query answers both the 404 check and the per-status counts: the
+    # grouped counts are outer-joined onto the project row
+    counts = await doc_service.count_by_status(project_id)
+    if counts is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
 
-    # Get document statistics
-    doc_service = DocumentService(db)
-    total = await doc_service.count(project_id)
-    indexed = await doc_service.count(project_id, index_status=IndexStatus.INDEXED)
-    pending = await doc_service.count(project_id, index_status=IndexStatus.PENDING)
-    failed = await doc_service.count(project_id, index_status=IndexStatus.FAILED)
+    total = sum(counts.values())
+    indexed = counts.get(IndexStatus.INDEXED, 0)
+    pending = counts.get(IndexStatus.PENDING, 0)
+    failed = counts.get(IndexStatus.FAILED, 0)
 
     return {
         "status": "valid" if indexed > 0 else "missing",
@@ -118,25 +114,4 @@ async def get_index_status(
         "indexed_documents": indexed,
         "pending_documents": pending,
         "failed_documents": failed,
-    }
-
-
-@router.get(
-    "/tasks/{task_id}",
-    response_model=TaskResult,
-    tags=["indexing"],
-)
-async def get_task_status(
-    task_id: str,
-
-) -> TaskResult:
-    """Get status of a specific task.
-
-    Args:
-        task_id: Task ID
-
-
-    Returns:
-        Task status information
-    """
-    return worker.get_task_status(task_id)
\ No newline at end of file
+    }
\ No newline at end of file
@@ -1,18 +1,40 @@
 """Prediction API endpoints."""
 
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterator, List, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...core.deps import get_db
+from ...core.deps import get_db, get_document_service
+from ...core.project_cache import get_project_status_cached
+from ...core.redis import redis_client
+from ...db.session import async_session
 from ...schemas.document import Document
 from ...services.documents import DocumentService
-from ...services.projects import ProjectService
 from ...tasks.prediction import predict_documents
+from ...worker import (
+    PREDICT_IDEMPOTENCY_TTL,
+    latest_predictions_tag_key,
+    predict_idempotency_key,
+)
 
 router = APIRouter()
 
+# Latest-prediction pages are polled by UIs far more often than they
+# change; a few seconds of Redis reuse absorbs those bursts, and the
+# worker drops the cached pages when a prediction task completes
+_LATEST_CACHE_TTL = 10
+
+# Serializing up to 1000 documents through FastAPI's jsonable_encoder
+# recursion dominates these handlers; a precompiled adapter dumps the
+# whole list in one pydantic-core call and orjson encodes it in C
+_DOCS_ADAPTER = TypeAdapter(List[Document])
+
 
 @router.post(
     "/{project_id}/predict",
@@ -39,35 +61,77 @@ async def trigger_prediction(
     Raises:
         HTTPException: If project not found or invalid state
     """
-    # Verify project exists and has trained model
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
+    # The project probe and the document existence check are independent,
+    # so overlap them. The document check runs on its own short-lived
+    # session — asyncpg forbids concurrent operations on one connection —
+    # and is a COUNT(*) the primary-key index answers without moving rows.
+    async def _count_ids() -> int:
+        async with async_session() as session:
+            return await DocumentService(session).count_by_ids(
+                project_id, document_ids
+            )
+
+    if document_ids:
+        project, found = await asyncio.gather(
+            get_project_status_cached(db, project_id),
+            _count_ids(),
+        )
+    else:
+        project = await get_project_status_cached(db, project_id)
+        found = None
+
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if project.model_status != "ready":
+    if project["model_status"] != "ready":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Model not ready for predictions",
         )
 
     # Verify documents exist if specific IDs provided
-    if document_ids:
-        doc_service = DocumentService(db)
-        docs = await doc_service.get_multi_by_ids(project_id, document_ids)
-        if len(docs) != len(document_ids):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="One or more documents not found",
-            )
+    if document_ids and found != len(set(document_ids)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="One or more documents not found",
+        )
 
-    # Trigger prediction task
-    task = predict_documents.delay(
+    # Client retries of an identical (project, document set) request
+    # reuse the in-flight task instead of inflating the queue; the
+    # worker clears the key when the task finishes (see worker.py)
+    idem_key = predict_idempotency_key(project_id, document_ids)
+    claimed = await redis_client.set(
+        idem_key, "pending", nx=True, ex=PREDICT_IDEMPOTENCY_TTL
+    )
+    if not claimed:
+        existing_task_id = await redis_client.get(idem_key)
+        if existing_task_id is not None:
+            if isinstance(existing_task_id, bytes):
+                existing_task_id = existing_task_id.decode()
+            # "pending" means another request claimed the key but has
+            # not published its task id yet; report the in-flight task
+            # either way instead of double-submitting. Only an expired
+            # key (None) falls through to a fresh submission.
+            return {
+                "task_id": (
+                    existing_task_id
+                    if existing_task_id != "pending"
+                    else None
+                ),
+                "status": "pending",
+                "message": "Prediction task already in progress",
+            }
+
+    # Trigger prediction task off the event loop; the Celery publish is
+    # a blocking broker round trip
+    task = await run_in_threadpool(
+        predict_documents.delay,
         project_id=project_id,
         document_ids=document_ids,
     )
+    await redis_client.set(idem_key, task.id, ex=PREDICT_IDEMPOTENCY_TTL)
 
     return {
         "task_id": task.id,
@@ -77,113 +141,154 @@ async def trigger_prediction(
 
 
 @router.get(
-    "/{project_id}/predict/{prediction_id}",
+    "/{project_id}/predict/latest",
     response_model=List[Document],
     tags=["prediction"],
 )
-async def get_prediction_results(
+async def get_latest_predictions(
     *,
     project_id: str,
-    prediction_id: str,
     db: AsyncSession = Depends(get_db),
+    doc_service: DocumentService = Depends(get_document_service),
 
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> List[Document]:
-    """Get prediction results.
+    """Get latest prediction results.
+
+    Registered before the parameterized results route: Starlette matches
+    in registration order, so the literal "latest" segment has to come
+    first or it would bind as a prediction_id.
 
     Args:
         project_id: Project ID
-        prediction_id: Prediction ID
         db: Database session
 
         skip: Number of documents to skip
         limit: Maximum number of documents to return
 
     Returns:
-        List of documents with predictions
+        List of documents with latest predictions
 
     Raises:
-        HTTPException: If project or prediction not found
+        HTTPException: If project not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
-        )
-
-    # Get documents with predictions
-    doc_service = DocumentService(db)
-    documents = await doc_service.get_multi(
+    cache_key = f"pred_latest:{project_id}:{skip}:{limit}"
+    cached = await redis_client.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(orjson.loads(cached))
+
+    # Fetch first; the project probe runs only when the page comes back
+    # empty, so the success path costs a single query
+    documents = await doc_service.get_latest_predicted(
         project_id=project_id,
-        prediction_id=prediction_id,
         skip=skip,
         limit=limit,
     )
 
     if not documents:
+        project = await get_project_status_cached(db, project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No predictions found",
         )
 
-    return list(documents)
+    # The service already returns a list; no defensive copy needed
+    payload = _DOCS_ADAPTER.dump_python(documents, mode="json")
+    await redis_client.set(
+        cache_key, orjson.dumps(payload), ex=_LATEST_CACHE_TTL
+    )
+    # Register the key in the project's tag set so the worker can drop
+    # all cached pages without a KEYS scan (see worker.py)
+    tag_key = latest_predictions_tag_key(project_id)
+    await redis_client.sadd(tag_key, cache_key)
+    await redis_client.expire(tag_key, _LATEST_CACHE_TTL * 6)
+
+    return ORJSONResponse(payload)
 
 
 @router.get(
-    "/{project_id}/predict/latest",
-    response_model=List[Document],
+    "/{project_id}/predict/{prediction_id}",
+    response_model=None,
+    responses={200: {"model": List[Document]}},
     tags=["prediction"],
 )
-async def get_latest_predictions(
+async def get_prediction_results(
     *,
     project_id: str,
+    prediction_id: str,
     db: AsyncSession = Depends(get_db),
+    doc_service: DocumentService = Depends(get_document_service),
 
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
-) -> List[Document]:
-    """Get latest prediction results.
+) -> StreamingResponse:
+    """Get prediction results.
 
     Args:
         project_id: Project ID
+        prediction_id: Prediction ID
         db: Database session
+        doc_service: Document service
 
         skip: Number of documents to skip
         limit: Maximum number of documents to return
 
     Returns:
-        List of documents with latest predictions
+        List of documents with predictions
 
     Raises:
-        HTTPException: If project not found
+        HTTPException: If project or prediction not found
     """
-    # Verify project exists
-    project_service = ProjectService(db)
-    project = await project_service.get(project_id)
-    if not project:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Project not found",
+    # Stream the page from a server-side cursor instead of materializing
+    # up to 1000 documents before serializing; the first byte goes out at
+    # the first row's latency and peak memory stays at one row
+    after_id = None
+    beyond_end = False
+    if skip:
+        after_id = await doc_service.resolve_skip_cursor(
+            project_id, skip=skip, prediction_id=prediction_id
         )
+        beyond_end = after_id is None
 
-    # Get documents with latest predictions
-    doc_service = DocumentService(db)
-    documents = await doc_service.get_multi(
+    documents = doc_service.stream_multi(
         project_id=project_id,
-        has_prediction=True,  # Only get documents with predictions
-        skip=skip,
-        limit=limit,
-        order_by="-updated_at",  # Order by most recent predictions
+        limit=limit if not beyond_end else 0,
+        after_id=after_id,
+        prediction_id=prediction_id,
     )
 
-    if not documents:
+    # Peek the first row before sending headers so the empty case can
+    # still pick between the two 404s
+    first: Optional[Document] = None
+    if not beyond_end:
+        try:
+            first = await documents.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+    if first is None:
+        project = await get_project_status_cached(db, project_id)
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No predictions found",
         )
 
-    return list(documents)
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        yield orjson.dumps(first.model_dump(mode="json"))
+        async for doc in documents:
+            yield b"," + orjson.dumps(doc.model_dump(mode="json"))
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
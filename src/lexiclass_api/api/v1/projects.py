@@ -3,24 +3,28 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 
-from ...core.deps import get_db
+from ...core.deps import get_project_service
 from ...schemas.project import Project, ProjectCreate, ProjectUpdate
 from ...services.projects import ProjectService
 
 router = APIRouter()
 
+# Validate and dump the whole page in one pydantic-core call instead of
+# FastAPI's per-item jsonable_encoder recursion
+_PROJECTS_ADAPTER = TypeAdapter(List[Project])
+
 
 @router.post("/", response_model=Project, status_code=status.HTTP_201_CREATED)
 async def create_project(
     *,
     project_in: ProjectCreate,
-    db: AsyncSession = Depends(get_db),
+    service: ProjectService = Depends(get_project_service),
 
 ) -> Project:
     """Create new project."""
-    service = ProjectService(db)
     project = await service.create(project_in)
     return project
 
@@ -28,11 +32,10 @@ async def create_project(
 @router.get("/{project_id}", response_model=Project)
 async def get_project(
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    service: ProjectService = Depends(get_project_service),
 
 ) -> Project:
     """Get project by ID."""
-    service = ProjectService(db)
     project = await service.get(project_id)
     if not project:
         raise HTTPException(
@@ -45,15 +48,18 @@ async def get_project(
 @router.get("/", response_model=List[Project])
 async def list_projects(
     *,
-    db: AsyncSession = Depends(get_db),
+    service: ProjectService = Depends(get_project_service),
 
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
 ) -> List[Project]:
     """List projects."""
-    service = ProjectService(db)
     projects = await service.get_multi(skip=skip, limit=limit)
-    return list(projects)
+    # .scalars().all() already returns a list; validate it in place
+    validated = _PROJECTS_ADAPTER.validate_python(
+        projects, from_attributes=True
+    )
+    return ORJSONResponse(_PROJECTS_ADAPTER.dump_python(validated, mode="json"))
 
 
 @router.put("/{project_id}", response_model=Project)
@@ -61,11 +67,10 @@ async def update_project(
     *,
     project_id: str,
     project_in: ProjectUpdate,
-    db: AsyncSession = Depends(get_db),
+    service: ProjectService = Depends(get_project_service),
 
 ) -> Project:
     """Update project."""
-    service = ProjectService(db)
     project = await service.get(project_id)
     if not project:
         raise HTTPException(
@@ -80,15 +85,14 @@ async def update_project(
 async def delete_project(
     *,
     project_id: str,
-    db: AsyncSession = Depends(get_db),
+    service: ProjectService = Depends(get_project_service),
 
 ) -> None:
     """Delete project."""
-    service = ProjectService(db)
-    project = await service.get(project_id)
-    if not project:
+    # One DELETE ... RETURNING answers the 404 check and the delete;
+    # database-level cascades remove the children
+    if not await service.delete_by_id(project_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    await service.delete(project)
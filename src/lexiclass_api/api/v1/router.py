@@ -7,11 +7,13 @@ from . import documents, fields, indexing, prediction, projects, tasks, training
 # Create API router
 api_router = APIRouter()
 
-# Include routers
+# Include routers. Every router except projects already tags its routes
+# at the decorator, so passing tags= here again would append a duplicate
+# tag to each operation and redo that work per route at import time.
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
-api_router.include_router(documents.router, prefix="/projects", tags=["documents"])
-api_router.include_router(indexing.router, prefix="/projects", tags=["indexing"])
-api_router.include_router(training.router, prefix="/projects", tags=["training"])
-api_router.include_router(prediction.router, prefix="/projects", tags=["prediction"])
-api_router.include_router(tasks.router, tags=["tasks"])
-api_router.include_router(fields.router, tags=["fields", "field-classes", "document-labels"])
+api_router.include_router(documents.router, prefix="/projects")
+api_router.include_router(indexing.router, prefix="/projects")
+api_router.include_router(training.router, prefix="/projects")
+api_router.include_router(prediction.router, prefix="/projects")
+api_router.include_router(tasks.router)
+api_router.include_router(fields.router)
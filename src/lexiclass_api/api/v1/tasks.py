@@ -2,16 +2,59 @@
 
 from typing import List
 
+import orjson
 from celery.result import AsyncResult
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ...core.deps import get_db
-from ...services.projects import ProjectService
-from ...worker import celery_app
+from ...core.project_cache import get_project_status_cached
+from ...core.redis import mget_task_statuses, redis_client
+from ...core.worker import TaskResult, worker
+from ...worker import celery_app, project_tasks_key
 
 router = APIRouter()
 
+# Polling UIs hammer the status endpoint; a short Redis TTL absorbs those
+# bursts without re-querying the result backend. Terminal states are
+# immutable, so they may be cached much longer.
+_STATUS_CACHE_TTL = 2
+_STATUS_CACHE_TTL_TERMINAL = 60
+_TERMINAL_STATES = {"SUCCESS", "FAILURE", "REVOKED"}
+
+
+@router.get(
+    "/tasks",
+    response_model=List[TaskResult],
+    tags=["tasks"],
+)
+async def get_task_statuses(
+    task_ids: List[str] = Query(..., min_length=1, max_length=500),
+
+) -> List[TaskResult]:
+    """Get statuses for a batch of tasks.
+
+    One backend round-trip for the whole batch instead of a request per
+    task; clients polling a bulk submission should use this. Lives on
+    the unprefixed tasks router: under /projects the path would be
+    swallowed by GET /projects/{project_id}.
+
+    Args:
+        task_ids: Task IDs to check
+
+    Returns:
+        Task status information in input order
+    """
+    return await run_in_threadpool(worker.get_task_statuses, task_ids)
+
 
 @router.get(
     "/tasks/{task_id}",
@@ -29,25 +72,49 @@ async def get_task_status(
 
     Returns:
         Task status information
-
-    Raises:
-        HTTPException: If task not found
     """
-    # Get task result
-    task = AsyncResult(task_id, app=celery_app)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-
-    # Return task status
-    return {
-        "task_id": task.id,
-        "status": task.status,
-        "result": task.result if task.ready() else None,
-        "error": str(task.result) if task.failed() else None,
-    }
+    cache_key = f"task-status:{task_id}"
+    cached = await redis_client.get(cache_key)
+    if cached is not None:
+        return orjson.loads(cached)
+
+    # Read the Celery result-backend key directly: one async Redis GET
+    # instead of an AsyncResult whose property accesses do synchronous
+    # socket IO on the event loop. A missing key is Celery's PENDING.
+    meta = await redis_client.get(f"celery-task-meta-{task_id}")
+    if meta is not None:
+        meta = orjson.loads(meta)
+        task_status = meta.get("status", "PENDING")
+        payload = {
+            "task_id": task_id,
+            "status": task_status,
+            "result": (
+                meta.get("result")
+                if task_status in _TERMINAL_STATES
+                else None
+            ),
+            "error": (
+                str(meta.get("result"))
+                if task_status == "FAILURE"
+                else None
+            ),
+        }
+    else:
+        payload = {
+            "task_id": task_id,
+            "status": "PENDING",
+            "result": None,
+            "error": None,
+        }
+    ttl = (
+        _STATUS_CACHE_TTL_TERMINAL
+        if payload["status"] in _TERMINAL_STATES
+        else _STATUS_CACHE_TTL
+    )
+    await redis_client.set(
+        cache_key, orjson.dumps(payload, default=str), ex=ttl
+    )
+    return payload
 
 
 @router.get(
@@ -73,36 +140,41 @@ async def list_project_tasks(
     Raises:
         HTTPException: If project not found
     """
-    # Verify project exists
-    service = ProjectService(db)
-    project = await service.get(project_id)
+    # Verify project exists via the Redis-cached status lookup
+    project = await get_project_status_cached(db, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
 
-    # Get active tasks from Celery
-    # Note: This is a simplified implementation
-    # In a production system, you would typically:
-    # 1. Store task IDs in the database with project association
-    # 2. Query the database for task IDs
-    # 3. Look up task status from Celery
-    i = celery_app.control.inspect()
+    # Workers maintain a project_tasks:{id} hash via task signals (see
+    # worker.py), so this is one HGETALL plus one MGET instead of a
+    # broadcast inspect RPC that scales with worker and task count
+    entries = await redis_client.hgetall(project_tasks_key(project_id))
+    if not entries:
+        return []
+
+    items = []
+    for task_id, raw in entries.items():
+        if isinstance(task_id, bytes):
+            task_id = task_id.decode()
+        items.append((task_id, orjson.loads(raw)))
+
+    statuses = await mget_task_statuses([task_id for task_id, _ in items])
     active_tasks = []
-    
-    # Get active tasks
-    if i.active():
-        for tasks in i.active().values():
-            for task in tasks:
-                if task.get("kwargs", {}).get("project_id") == project_id:
-                    task_result = AsyncResult(task["id"], app=celery_app)
-                    active_tasks.append({
-                        "task_id": task["id"],
-                        "name": task["name"],
-                        "status": task_result.status,
-                        "started_at": task["time_start"],
-                    })
+    for task_id, entry in items:
+        task_status = statuses[task_id].get("status", "PENDING")
+        # Anything still in the in-flight index with no backend entry
+        # has started but not reported yet
+        if task_status == "PENDING":
+            task_status = "STARTED"
+        active_tasks.append({
+            "task_id": task_id,
+            "name": entry.get("name"),
+            "status": task_status,
+            "started_at": entry.get("started_at"),
+        })
 
     return active_tasks
 
@@ -114,12 +186,17 @@ async def list_project_tasks(
 )
 async def cancel_task(
     task_id: str,
+    background_tasks: BackgroundTasks,
 
 ) -> None:
     """Cancel a running task.
 
+    The revoke is scheduled after the response is sent; it broadcasts to
+    every worker over the broker, so clients should not wait on it.
+
     Args:
         task_id: Task ID
+        background_tasks: FastAPI background task scheduler
 
 
     Raises:
@@ -133,12 +210,13 @@ async def cancel_task(
             detail="Task not found",
         )
 
-    # Check if task can be canceled
-    if task.ready():
+    # ready() and revoke() talk to the backend/broker synchronously, so
+    # keep them off the event loop
+    if await run_in_threadpool(task.ready):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Task already completed",
         )
 
-    # Revoke task
-    task.revoke(terminate=True)
+    # Revoke after the 204 goes out; sync callables run in the threadpool
+    background_tasks.add_task(lambda: task.revoke(terminate=True))
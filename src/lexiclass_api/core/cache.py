@@ -0,0 +1,44 @@
+"""Small in-process caches for hot lookup results."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+
+class TTLCache:
+    """TTL + LRU cache for per-id lookup results.
+
+    Entries expire after ``ttl`` seconds and the least recently stored
+    entries are evicted past ``maxsize``. Missing rows can be cached as
+    values (e.g. None) — absence is signalled via the MISSING sentinel,
+    not the value itself. Process-local only; callers must invalidate on
+    mutation.
+    """
+
+    MISSING: Any = object()
+
+    def __init__(self, *, ttl: float, maxsize: int) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or TTLCache.MISSING if absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return self.MISSING
+        if time.monotonic() - entry[0] >= self._ttl:
+            self._entries.pop(key, None)
+            return self.MISSING
+        return entry[1]
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the oldest entries past maxsize."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a cached entry after a mutation."""
+        self._entries.pop(key, None)
@@ -1,6 +1,8 @@
 """Celery application configuration for LexiClass API."""
 
-from typing import Dict, Any
+import functools
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from celery import Celery
 from lexiclass_core.queue_config import (
@@ -12,10 +14,15 @@ from lexiclass_core.queue_config import (
 from lexiclass_api.core.config import settings
 
 
-def get_task_annotations() -> Dict[str, Dict[str, Any]]:
-    """Get task-specific annotations from queue configs."""
-    return {
-        f"lexiclass_api.tasks.{queue.name}_task": {
+@functools.cache
+def get_task_annotations() -> Mapping[str, Mapping[str, Any]]:
+    """Get task-specific annotations from queue configs.
+
+    QUEUE_CONFIGS is static for the process lifetime, so the mapping is
+    built once and frozen; repeated callers share the same object.
+    """
+    return MappingProxyType({
+        f"lexiclass_api.tasks.{queue.name}_task": MappingProxyType({
             "rate_limit": queue.rate_limit,
             "retry_backoff": True,
             "retry_backoff_max": queue.retry_policy["interval_max"],
@@ -23,8 +30,8 @@ def get_task_annotations() -> Dict[str, Dict[str, Any]]:
             "max_retries": queue.retry_policy["max_retries"],
             "retry_delay": queue.retry_policy["interval_start"],
             "retry_kwargs": {"max_delay": queue.retry_policy["interval_max"]},
-        } for queue in QUEUE_CONFIGS.values()
-    }
+        }) for queue in QUEUE_CONFIGS.values()
+    })
 
 
 # Create Celery app
@@ -1,15 +1,56 @@
 """Configuration settings for the API service."""
 
+import functools
+import os
+import pickle
 from pathlib import Path
 from typing import Any, Dict, List, Optional
+from urllib.parse import quote_plus
 
-from pydantic import (
-    PostgresDsn,
-    RedisDsn,
-    field_validator,
-)
+from types import MappingProxyType
+from typing import Final
+
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Module-level so pydantic doesn't deep-copy the structure into every
+# Settings instance (each Celery fork builds one); the proxy keeps the
+# shared dict read-only.
+_LOGGING_CONFIG: Final = MappingProxyType({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json": {
+            "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
+            "format": "%(timestamp)s %(level)s %(name)s %(message)s",
+        },
+        "standard": {
+            "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "json",
+        },
+    },
+    "root": {
+        "handlers": ["console"],
+        "level": "INFO",
+    },
+})
+
+
+# Path composition is pure, and the same project ids recur thousands of
+# times during bulk indexing; cache the built Path objects. Module-level
+# helper because Settings instances are not hashable.
+@functools.lru_cache(maxsize=1024)
+def _project_path(
+    storage_path: Path, project_id: str, subdir: Optional[str] = None
+) -> Path:
+    path = storage_path / project_id
+    return path / subdir if subdir else path
+
 
 class Settings(BaseSettings):
     """API service settings."""
@@ -33,9 +74,13 @@ class Settings(BaseSettings):
     # CORS Settings
     CORS_ORIGINS_STR: str = "http://localhost:3000,http://localhost:8000"
     
-    @property
+    @functools.cached_property
     def CORS_ORIGINS(self) -> List[str]:
-        """Get list of CORS origins."""
+        """Get list of CORS origins.
+
+        The source string never changes after startup, so the split runs
+        once and later accesses read the cached list.
+        """
         return [origin.strip() for origin in self.CORS_ORIGINS_STR.split(",") if origin.strip()]
 
     # Database
@@ -44,32 +89,38 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
-    DATABASE_URI: Optional[PostgresDsn] = None
+    DATABASE_URI: Optional[str] = None
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
 
     @field_validator("DATABASE_URI", mode="before")
     @classmethod
     def assemble_db_uri(
         cls, v: Optional[str], values: Dict[str, Any]
-    ) -> PostgresDsn:
-        """Construct database URI from components."""
+    ) -> str:
+        """Construct database URI from components.
+
+        Plain string assembly: every component is already known, so the
+        pydantic-core URL parse/re-serialize cycle buys nothing here.
+        """
         if isinstance(v, str):
-            return PostgresDsn(v)
-
-        return PostgresDsn.build(
-            scheme="postgresql+asyncpg",
-            username=values.data["POSTGRES_USER"],
-            password=values.data["POSTGRES_PASSWORD"],
-            host=values.data["POSTGRES_HOST"],
-            port=int(values.data["POSTGRES_PORT"]),
-            path=values.data["POSTGRES_DB"],
+            return v
+
+        return (
+            "postgresql+asyncpg://"
+            f"{values.data['POSTGRES_USER']}"
+            f":{quote_plus(values.data['POSTGRES_PASSWORD'])}"
+            f"@{values.data['POSTGRES_HOST']}"
+            f":{int(values.data['POSTGRES_PORT'])}"
+            f"/{values.data['POSTGRES_DB']}"
         )
 
     # Redis and Celery
     REDIS_HOST: str
     REDIS_PORT: str
     REDIS_PASSWORD: Optional[str] = None
-    CELERY_BROKER_URL: Optional[RedisDsn] = None
-    CELERY_RESULT_BACKEND: Optional[RedisDsn] = None
+    CELERY_BROKER_URL: Optional[str] = None
+    CELERY_RESULT_BACKEND: Optional[str] = None
     
     # Celery Settings
     CELERY_TASK_SERIALIZER: str = "json"
@@ -84,7 +135,11 @@ class Settings(BaseSettings):
     CELERY_TASK_MAX_RETRIES: int = 3
     CELERY_TASK_SOFT_TIME_LIMIT: int = 600
     CELERY_TASK_TIME_LIMIT: int = 1200
-    CELERY_WORKER_PREFETCH_MULTIPLIER: int = 4
+    # Tasks here are long-running and DB/model-bound; prefetching more
+    # than one leaves queued jobs stuck behind a busy worker while peers
+    # idle
+    CELERY_WORKER_PREFETCH_MULTIPLIER: int = 1
+    CELERY_WORKER_CONCURRENCY: Optional[int] = None
     CELERY_WORKER_MAX_TASKS_PER_CHILD: int = 1000
     CELERY_WORKER_SEND_TASK_EVENTS: bool = True
 
@@ -92,16 +147,20 @@ class Settings(BaseSettings):
     @classmethod
     def assemble_redis_uri(
         cls, v: Optional[str], values: Dict[str, Any]
-    ) -> RedisDsn:
-        """Construct Redis URI from components."""
+    ) -> str:
+        """Construct Redis URI from components.
+
+        Same string assembly as the database URI; /0 matches the default
+        database the validated DSN used to carry.
+        """
         if isinstance(v, str):
-            return RedisDsn(v)
+            return v
 
-        return RedisDsn.build(
-            scheme="redis",
-            host=values.data["REDIS_HOST"],
-            port=int(values.data["REDIS_PORT"]),
-            password=values.data.get("REDIS_PASSWORD"),
+        password = values.data.get("REDIS_PASSWORD")
+        auth = f":{quote_plus(password)}@" if password else ""
+        return (
+            f"redis://{auth}{values.data['REDIS_HOST']}"
+            f":{int(values.data['REDIS_PORT'])}/0"
         )
 
     # Storage
@@ -116,7 +175,7 @@ class Settings(BaseSettings):
         Returns:
             Path to project storage directory
         """
-        return self.STORAGE_PATH / project_id
+        return _project_path(self.STORAGE_PATH, project_id)
 
     def get_models_path(self, project_id: str) -> Path:
         """Get the models path for a project.
@@ -127,7 +186,7 @@ class Settings(BaseSettings):
         Returns:
             Path to project models directory
         """
-        return self.get_project_storage_path(project_id) / "models"
+        return _project_path(self.STORAGE_PATH, project_id, "models")
 
     def get_indexes_path(self, project_id: str) -> Path:
         """Get the indexes path for a project.
@@ -138,7 +197,7 @@ class Settings(BaseSettings):
         Returns:
             Path to project indexes directory
         """
-        return self.get_project_storage_path(project_id) / "indexes"
+        return _project_path(self.STORAGE_PATH, project_id, "indexes")
 
     def get_documents_path(self, project_id: str) -> Path:
         """Get the documents path for a project.
@@ -149,37 +208,75 @@ class Settings(BaseSettings):
         Returns:
             Path to project documents directory
         """
-        return self.get_project_storage_path(project_id) / "documents"
+        return _project_path(self.STORAGE_PATH, project_id, "documents")
 
     # Logging
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "json"
-    LOGGING_CONFIG: Dict[str, Any] = {
-        "version": 1,
-        "disable_existing_loggers": False,
-        "formatters": {
-            "json": {
-                "()": "pythonjsonlogger.jsonlogger.JsonFormatter",
-                "format": "%(timestamp)s %(level)s %(name)s %(message)s",
-            },
-            "standard": {
-                "format": "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-            },
-        },
-        "handlers": {
-            "console": {
-                "class": "logging.StreamHandler",
-                "formatter": "json",
-            },
-        },
-        "root": {
-            "handlers": ["console"],
-            "level": "INFO",
-        },
-    }
+
+    @functools.cached_property
+    def LOGGING_CONFIG(self) -> MappingProxyType:
+        """Shared read-only logging config.
+
+        dictConfig copies what it needs, so handing out the one proxy is
+        safe and avoids a per-instance deep copy of the structure.
+        """
+        return _LOGGING_CONFIG
+
 
 
 
 
+_settings: Optional[Settings] = None
 
-settings = Settings()  # type: ignore
+_SETTINGS_CACHE_PATH = Path("/dev/shm/lexiclass_settings.pkl")
+
+
+def _load_settings() -> Settings:
+    """Build Settings, optionally through the shared validated cache.
+
+    With LEXICLASS_SETTINGS_CACHE=1, the first process to validate
+    settings pickles the dumped fields under /dev/shm; re-forked worker
+    children (worker_max_tasks_per_child recycles them constantly) then
+    rebuild via model_construct, skipping .env parsing and DSN
+    validation. Best-effort: any cache failure falls back to a full
+    validated load.
+    """
+    if os.environ.get("LEXICLASS_SETTINGS_CACHE") != "1":
+        return Settings()  # type: ignore
+
+    try:
+        with _SETTINGS_CACHE_PATH.open("rb") as fh:
+            return Settings.model_construct(**pickle.load(fh))
+    except (OSError, pickle.PickleError, TypeError, EOFError):
+        pass
+
+    loaded = Settings()  # type: ignore
+    try:
+        tmp = _SETTINGS_CACHE_PATH.with_name(
+            f"{_SETTINGS_CACHE_PATH.name}.{os.getpid()}"
+        )
+        with tmp.open("wb") as fh:
+            pickle.dump(loaded.model_dump(), fh)
+        tmp.replace(_SETTINGS_CACHE_PATH)
+    except OSError:
+        pass
+    return loaded
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the settings singleton lazily (PEP 562).
+
+    Instantiating Settings parses .env and validates the Postgres/Redis
+    DSNs; deferring it to first attribute access keeps that cost out of
+    entry points that never read configuration (management one-offs,
+    re-forked worker children importing modules). Existing
+    `from .config import settings` sites resolve through this hook and
+    share the one cached instance.
+    """
+    global _settings
+    if name == "settings":
+        if _settings is None:
+            _settings = _load_settings()
+        return _settings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
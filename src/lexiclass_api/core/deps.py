@@ -1,14 +1,33 @@
 """Dependencies for FastAPI application."""
 
-from collections.abc import AsyncGenerator
-from typing import Any
-
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db.session import get_db as get_db_session
+from ..services.documents import DocumentService
+from ..services.projects import ProjectService
+
+# Direct alias: the async-for wrapper added one async-generator frame
+# (an extra coroutine allocation and __anext__ trampoline) to every
+# request without adding logic. FastAPI inspects the aliased function
+# itself, so dependency semantics are unchanged.
+get_db = get_db_session
+
+
+def get_project_service(
+    db: AsyncSession = Depends(get_db),
+) -> ProjectService:
+    """Get a request-scoped project service.
+
+    FastAPI caches dependency results per request, so endpoints that need
+    the service more than once share a single instance (and the same
+    session as any plain get_db dependency in the signature).
+    """
+    return ProjectService(db)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, Any]:
-    """Get database session."""
-    async for session in get_db_session():
-        yield session
\ No newline at end of file
+def get_document_service(
+    db: AsyncSession = Depends(get_db),
+) -> DocumentService:
+    """Get a request-scoped document service."""
+    return DocumentService(db)
\ No newline at end of file
@@ -1,5 +1,10 @@
 """OpenAPI documentation configuration."""
 
+from typing import Optional
+
+import orjson
+from fastapi import FastAPI
+
 description = """
 # LexiClass API
 
@@ -96,3 +101,20 @@ license_info = {
 }
 
 terms_of_service = "https://example.com/terms/"
+
+
+_openapi_bytes: Optional[bytes] = None
+
+
+def get_openapi_bytes(app: FastAPI) -> bytes:
+    """Serialized /openapi.json payload, rendered once.
+
+    The schema is immutable after startup. FastAPI caches the schema
+    dict but its stock route still runs dict-to-JSON serialization on
+    every hit; caching the orjson bytes makes repeat docs loads a memory
+    read.
+    """
+    global _openapi_bytes
+    if _openapi_bytes is None:
+        _openapi_bytes = orjson.dumps(app.openapi())
+    return _openapi_bytes
@@ -0,0 +1,70 @@
+"""Redis-backed read-through cache for project status lookups.
+
+The prediction, training and task endpoints hit the database on every
+request just to verify a project exists and read its model status —
+fields that change only when training completes or the project is
+edited. A short Redis TTL with explicit invalidation from the mutation
+paths serves those polls without a SQL round trip, and works across
+API processes where the in-process service cache cannot.
+"""
+
+from typing import Any, Dict, Optional
+
+import orjson
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .redis import redis_client
+from ..models.project import Project
+
+_CACHE_TTL = 30
+
+
+def _key(project_id: str) -> str:
+    return f"project:{project_id}"
+
+
+async def get_project_status_cached(
+    db: AsyncSession, project_id: str
+) -> Optional[Dict[str, Any]]:
+    """Get a project's existence and model-status fields, Redis-cached.
+
+    Returns a dict with model_status, model_version, model_metrics and
+    model_updated_at, or None when the project does not exist (misses are
+    cached too, so repeated polls for a bad id stay off the database).
+    Datetimes round-trip as ISO strings, which is what the endpoints
+    serialize anyway.
+    """
+    cached = await redis_client.get(_key(project_id))
+    if cached is not None:
+        payload = orjson.loads(cached)
+        return payload if payload.get("exists") else None
+
+    result = await db.execute(
+        select(
+            Project.model_status,
+            Project.model_version,
+            Project.model_metrics,
+            Project.model_updated_at,
+        ).where(Project.id == project_id)
+    )
+    row = result.first()
+    if row is None:
+        payload = {"exists": False}
+    else:
+        payload = {
+            "exists": True,
+            "model_status": row[0],
+            "model_version": row[1],
+            "model_metrics": row[2],
+            "model_updated_at": row[3],
+        }
+    await redis_client.set(
+        _key(project_id), orjson.dumps(payload, default=str), ex=_CACHE_TTL
+    )
+    return payload if payload["exists"] else None
+
+
+async def invalidate_project_cache(project_id: str) -> None:
+    """Drop a project's cached status after a mutation."""
+    await redis_client.delete(_key(project_id))
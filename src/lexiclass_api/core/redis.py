@@ -0,0 +1,41 @@
+"""Shared async Redis client."""
+
+from typing import Dict, Sequence
+
+import orjson
+import redis.asyncio as redis
+
+from .config import settings
+
+# One client (and connection pool) per process, shared by every endpoint
+# that needs Redis; the Celery result backend DSN points at the same
+# instance the workers already use.
+redis_client: redis.Redis = redis.Redis.from_url(
+    str(settings.CELERY_RESULT_BACKEND)
+)
+
+
+async def mget_task_statuses(task_ids: Sequence[str]) -> Dict[str, dict]:
+    """Fetch many Celery result-backend payloads in one MGET.
+
+    One round trip instead of one GET per task; ids with no backend
+    entry yet map to a PENDING placeholder, matching Celery semantics.
+
+    Args:
+        task_ids: Celery task ids to look up
+
+    Returns:
+        Mapping of task id to its decoded result-backend payload
+    """
+    if not task_ids:
+        return {}
+
+    raw = await redis_client.mget(
+        *[f"celery-task-meta-{task_id}" for task_id in task_ids]
+    )
+    return {
+        task_id: orjson.loads(entry)
+        if entry is not None
+        else {"status": "PENDING"}
+        for task_id, entry in zip(task_ids, raw)
+    }
@@ -1,12 +1,54 @@
 """Document storage utilities - uses shared DocumentStorage from lexiclass_core."""
 
+from pathlib import Path
+from typing import Dict
+
 import lexiclass_core
 from lexiclass_core.storage import DocumentStorage
 
 from .config import settings
 
-# Create a singleton instance configured with API's storage path
-document_storage = DocumentStorage(settings.STORAGE_PATH)
+
+class _EnsuredDirStorage(DocumentStorage):
+    """DocumentStorage that ensures each project directory only once.
+
+    The base _get_project_path runs makedirs on every call, which is a
+    stat syscall per document during bulk writes. The first call per
+    project still pays it; afterwards the cached Path is returned with
+    no filesystem access. Process-local, like the storage instance
+    itself.
+    """
+
+    def __init__(self, storage_path: Path) -> None:
+        super().__init__(storage_path)
+        self._ensured_paths: Dict[str, Path] = {}
+
+    def _get_project_path(self, project_id: str) -> Path:
+        path = self._ensured_paths.get(project_id)
+        if path is None:
+            path = super()._get_project_path(project_id)
+            self._ensured_paths[project_id] = path
+        return path
+
+    def forget_project(self, project_id: str) -> None:
+        """Drop the ensured-path entry after the directory was removed.
+
+        Without this, a recreated project with the same id would skip the
+        makedirs and write into a directory that no longer exists.
+        """
+        self._ensured_paths.pop(project_id, None)
+
+# Create a singleton instance configured with API's storage path. Keep
+# this module a thin re-export: duplicating DocumentStorage here would
+# mean per-call makedirs/path-building again instead of the shared
+# instance's own caching.
+#
+# Known scaling limit: the flat <project>/<document_id>.txt layout puts
+# every document of a project in one directory, which degrades readdir/
+# lookup past ~1e5 files. Sharding by id prefix has to land in
+# lexiclass_core (the worker reads the same paths), not here — changing
+# the layout on the API side alone would orphan every stored document.
+document_storage = _EnsuredDirStorage(settings.STORAGE_PATH)
 
 # Configure lexiclass_core to use this instance
 lexiclass_core.configure_document_storage(document_storage)
@@ -3,12 +3,14 @@
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
 
 from .api.v1.router import api_router
 from .core.config import settings
+from .db.session import warm_pool
 
 
 
@@ -18,13 +20,21 @@ async def lifespan(app: FastAPI):
     # Setup
     logger = logging.getLogger(__name__)
     logger.info("Starting application")
+    await warm_pool()
     yield
     # Cleanup
     logger.info("Shutting down application")
 
 
 # Create FastAPI app
-from .core.openapi import description, tags_metadata, contact, license_info, terms_of_service
+from .core.openapi import (
+    contact,
+    description,
+    get_openapi_bytes,
+    license_info,
+    tags_metadata,
+    terms_of_service,
+)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -37,8 +47,27 @@ app = FastAPI(
     terms_of_service=terms_of_service,
     docs_url="/docs",
     redoc_url="/redoc",
+    # Serialize every response through orjson; the task/status endpoints
+    # return plain dicts and benefit as much as the list endpoints that
+    # already build ORJSONResponse explicitly
+    default_response_class=ORJSONResponse,
 )
 
+# Serve the schema from cached orjson bytes: the stock route
+# re-serializes the (already cached) schema dict on every docs load, so
+# drop it and register a byte-cached replacement
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json() -> Response:
+    """Cached OpenAPI schema."""
+    return Response(get_openapi_bytes(app), media_type="application/json")
+
+
 # Set up CORS
 if settings.CORS_ORIGINS:
     app.add_middleware(
@@ -1,21 +1,20 @@
-"""Models package - re-exports models from lexiclass_core.
+"""Models package.
 
-All database models are now defined in lexiclass_core and re-exported here
-for backward compatibility with existing API code.
+Re-exports the local model modules — the ones every service queries
+through. Previously this re-exported lexiclass_core.models instead,
+which registered a second, parallel set of mappers for the same tables
+(the services never used them; package consumers only wanted the enums),
+doubling mapper configuration and event-listener dispatch.
 """
 
-from lexiclass_core.models import (
-    Base,
-    Document,
-    DocumentLabel,
-    Field,
-    FieldClass,
-    IndexStatus,
-    Model,
-    ModelStatus,
-    Prediction,
-    Project,
-)
+from .base import Base
+from .document import Document, IndexStatus
+from .document_label import DocumentLabel
+from .field import Field
+from .field_class import FieldClass
+from .model import Model, ModelStatus
+from .prediction import Prediction
+from .project import Project
 from .task import Task
 
 __all__ = [
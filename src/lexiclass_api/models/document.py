@@ -55,7 +55,7 @@ class Document(Base):
         nullable=False,
     )
     index_status: Mapped[IndexStatus] = mapped_column(
-        Enum(IndexStatus, native_enum=False, length=50),
+        Enum(IndexStatus, name="indexstatus"),
         default=IndexStatus.PENDING,
         nullable=False,
         index=True,
@@ -73,19 +73,13 @@ class Document(Base):
     )
 
 
-# SQLAlchemy event listeners
-@event.listens_for(Document, "after_insert")
-def store_document_after_insert(mapper, connection, target):
-    """Store document content after insert."""
-    if target._content is not None:
-        path = document_storage.store_document(target.project_id, target.id, target._content)
-        target.content_path = str(path)
-        # Update content_path in database
-        connection.execute(
-            Document.__table__.update().where(Document.id == target.id),
-            {"content_path": str(path)}
-        )
-
+# SQLAlchemy event listeners.
+#
+# There is deliberately no after_insert content writer: it did a blocking
+# file write plus a per-row content_path UPDATE inside the transaction.
+# DocumentService.create_bulk stores the whole batch's content in one
+# threadpool hop and inserts content_path with the rows, so creation is
+# one multi-row INSERT and zero listener work.
 @event.listens_for(Document, "before_delete")
 def delete_document_before_delete(mapper, connection, target):
     """Delete document content before deleting the record."""
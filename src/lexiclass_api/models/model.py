@@ -47,7 +47,7 @@ class Model(Base):
         nullable=True,
     )
     status: Mapped[ModelStatus] = mapped_column(
-        Enum(ModelStatus, native_enum=False, length=50),
+        Enum(ModelStatus, name="modelstatus"),
         nullable=False,
     )
     trained_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
@@ -1,10 +1,11 @@
 """DocumentLabel service layer."""
 
 import logging
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import List, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.document_label import DocumentLabel
@@ -73,6 +74,13 @@ class DocumentLabelService:
         )
         return result.scalar_one_or_none()
 
+    async def get_updated_at(self, label_id: str) -> Optional[datetime]:
+        """Get a label's updated_at timestamp without fetching the row."""
+        result = await self.db.execute(
+            select(DocumentLabel.updated_at).where(DocumentLabel.id == label_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_document(
         self,
         document_id: str,
@@ -90,6 +98,39 @@ class DocumentLabelService:
         )
         return result.scalars().all()
 
+    async def get_by_document_rows(
+        self,
+        document_id: str,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Get a keyset page of labels by document ID as plain column dicts.
+
+        Projects columns directly instead of hydrating ORM rows, so list
+        endpoints can serialize the dicts without model validation. Pages
+        are ordered by id and resumed via after_id, keeping page cost
+        constant regardless of depth.
+        """
+        query = (
+            select(
+                DocumentLabel.id,
+                DocumentLabel.document_id,
+                DocumentLabel.field_id,
+                DocumentLabel.class_id,
+                DocumentLabel.is_training_data,
+                DocumentLabel.created_at,
+                DocumentLabel.updated_at,
+            )
+            .where(DocumentLabel.document_id == document_id)
+            .order_by(DocumentLabel.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(DocumentLabel.id > after_id)
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
     async def get_by_document_and_field(
         self, document_id: str, field_id: str
     ) -> Optional[DocumentLabel]:
@@ -101,6 +142,21 @@ class DocumentLabelService:
         )
         return result.scalar_one_or_none()
 
+    async def has_training_labels(self, field_id: str) -> bool:
+        """Check whether a field has any training labels.
+
+        A SELECT EXISTS stops at the first match instead of fetching and
+        hydrating a row just for a truthiness check.
+        """
+        result = await self.db.execute(
+            select(
+                exists()
+                .where(DocumentLabel.field_id == field_id)
+                .where(DocumentLabel.is_training_data.is_(True))
+            )
+        )
+        return bool(result.scalar())
+
     async def get_by_field(
         self,
         field_id: str,
@@ -144,6 +200,61 @@ class DocumentLabelService:
         )
         return db_obj
 
+    async def update_by_id(
+        self,
+        label_id: str,
+        obj_in: DocumentLabelUpdate,
+    ) -> Optional[DocumentLabel]:
+        """Update document label by ID.
+
+        Fuses the existence check and the mutation into a single
+        UPDATE ... RETURNING round trip; returns None if no label matched.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get(label_id)
+
+        result = await self.db.execute(
+            update(DocumentLabel)
+            .where(DocumentLabel.id == label_id)
+            .values(**update_data)
+            .returning(DocumentLabel)
+        )
+        db_obj = result.scalar_one_or_none()
+        await self.db.commit()
+        if db_obj is None:
+            return None
+
+        logger.info(
+            "Updated document label",
+            extra={
+                "label_id": label_id,
+                "updated_fields": list(update_data.keys()),
+            },
+        )
+        return db_obj
+
+    async def delete_by_id(self, label_id: str) -> bool:
+        """Delete document label by ID with a single DELETE ... RETURNING.
+
+        Returns True if a label was deleted, False if none matched.
+        """
+        result = await self.db.execute(
+            delete(DocumentLabel)
+            .where(DocumentLabel.id == label_id)
+            .returning(DocumentLabel.id)
+        )
+        deleted_id = result.scalar_one_or_none()
+        await self.db.commit()
+        if deleted_id is None:
+            return False
+
+        logger.info(
+            "Deleted document label",
+            extra={"label_id": label_id},
+        )
+        return True
+
     async def delete(self, db_obj: DocumentLabel) -> None:
         """Delete document label."""
         label_id = db_obj.id
@@ -1,6 +1,8 @@
 """Document service."""
 
-from typing import List, Optional, Sequence
+import logging
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence
 import uuid
 
 # Service constants
@@ -9,13 +11,74 @@ DEFAULT_PAGE_SIZE = 100  # Default number of documents per page
 MAX_BATCH_SIZE = 500  # Maximum number of documents in a bulk create operation
 
 from fastapi import HTTPException, status
-from sqlalchemy import func, select
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
+from ..core.storage import document_storage
 from ..models.document import Document as DocumentModel, IndexStatus
+from ..models.prediction import Prediction
+from ..models.project import Project
 from ..schemas.document import DocumentBulkCreate, Document
 
+logger = logging.getLogger(__name__)
+
+
+def _id_in_array(document_ids: List[str]) -> ColumnElement[bool]:
+    """Build an `id = ANY(:ids)` predicate over a single array parameter.
+
+    Unlike ``id.in_(...)``, which expands to one placeholder per element,
+    this binds the whole list as one ``varchar[]`` parameter, so a
+    1000-id request ships one value and one plan.
+    """
+    return DocumentModel.id == any_(cast(document_ids, ARRAY(String())))
+
+
+def _build_list_stmt(
+    with_label: bool, with_status: bool, with_cursor: bool
+) -> Select:
+    """Build one listing statement for a fixed predicate combination."""
+    stmt = select(DocumentModel).where(DocumentModel.project_id == bindparam("pid"))
+    if with_label:
+        stmt = stmt.where(DocumentModel.label == bindparam("label"))
+    if with_status:
+        stmt = stmt.where(DocumentModel.index_status == bindparam("status"))
+    if with_cursor:
+        stmt = stmt.where(DocumentModel.id > bindparam("after_id"))
+    stmt = stmt.order_by(DocumentModel.id)
+    if not with_cursor:
+        stmt = stmt.offset(bindparam("skip"))
+    return stmt.limit(bindparam("limit"))
+
+
+# The listing query only varies by which optional predicates are present,
+# so the eight possible statements are built once at import time. get_multi
+# then does a dict lookup and binds parameters, and reusing the same
+# statement objects keeps SQLAlchemy's compiled-SQL cache hot.
+_LIST_STMT_CACHE = {
+    (with_label, with_status, with_cursor): _build_list_stmt(
+        with_label, with_status, with_cursor
+    )
+    for with_label in (False, True)
+    for with_status in (False, True)
+    for with_cursor in (False, True)
+}
+
 
 class DocumentService:
     """Document service."""
@@ -43,7 +106,7 @@ class DocumentService:
         if not document_ids:
             return
 
-        query = select(DocumentModel.id).where(DocumentModel.id.in_(document_ids))
+        query = select(DocumentModel.id).where(_id_in_array(document_ids))
         result = await self.db.execute(query)
         existing_ids = result.scalars().all()
 
@@ -82,36 +145,87 @@ class DocumentService:
                 detail=f"Batch size exceeds maximum limit of {MAX_BATCH_SIZE} documents"
             )
 
+        stored_ids: List[str] = []
         try:
             # Check for existing IDs
             existing_ids = [doc.id for doc in documents_in.documents if doc.id is not None]
             await self._check_existing_ids(existing_ids)
 
-            # Create document models
-            db_documents = [
-                DocumentModel(
-                    project_id=project_id,
-                    id=doc.id or str(uuid.uuid4()),  # Use provided ID or generate UUID
-                    content_path="",  # Will be set by the model after insert
-                    _content=doc.content,  # This will trigger content storage
-                    doc_metadata=doc.metadata,  # Note: using doc_metadata to match model field name
-                    label=doc.label,
-                    index_status=IndexStatus.PENDING,
-                )
+            # IDs are client-generated, so content can be stored before the
+            # insert and content_path set in the same row, instead of the
+            # per-row after_insert UPDATE the ORM path required.
+            now = datetime.utcnow()
+            payloads = [
+                (doc.id or str(uuid.uuid4()), doc)
                 for doc in documents_in.documents
             ]
 
-            # Add to DB
-            self.db.add_all(db_documents)
+            # The storage writes are blocking file IO; run the whole batch
+            # in one worker-thread hop instead of blocking the event loop
+            # (or paying a thread dispatch) per document
+            def _store_all() -> List:
+                return [
+                    document_storage.store_document(
+                        project_id, doc_id, doc.content
+                    )
+                    for doc_id, doc in payloads
+                ]
+
+            content_paths = await run_in_threadpool(_store_all)
+            stored_ids = [doc_id for doc_id, _ in payloads]
+
+            rows = []
+            for (doc_id, doc), content_path in zip(payloads, content_paths):
+                rows.append({
+                    "id": doc_id,
+                    "project_id": project_id,
+                    "content_path": str(content_path),
+                    "doc_metadata": doc.metadata,  # Note: using doc_metadata to match model field name
+                    "label": doc.label,
+                    "index_status": IndexStatus.PENDING,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+
+            # One multi-row INSERT: a single round trip and WAL flush for
+            # the whole batch instead of one per document. No refresh pass
+            # is needed since every column value is known client-side.
+            await self.db.execute(insert(DocumentModel), rows)
             await self.db.commit()
 
-            # Refresh to get generated values
-            for doc in db_documents:
-                await self.db.refresh(doc)
-
-            return [self._convert_to_pydantic(doc) for doc in db_documents]
+            return [
+                Document.model_validate(
+                    {
+                        **{k: v for k, v in row.items() if k != "doc_metadata"},
+                        "metadata": row["doc_metadata"],
+                    }
+                )
+                for row in rows
+            ]
         except SQLAlchemyError as e:
             await self.db.rollback()
+
+            # Content is written before the INSERT, so a failed insert
+            # would otherwise leave the whole batch orphaned on disk
+            # with no DB row pointing at it
+            if stored_ids:
+                def _discard_all() -> None:
+                    for doc_id in stored_ids:
+                        try:
+                            document_storage.delete_document(
+                                project_id, doc_id
+                            )
+                        except OSError:
+                            logger.warning(
+                                "Failed to remove orphaned content",
+                                extra={
+                                    "project_id": project_id,
+                                    "document_id": doc_id,
+                                },
+                            )
+
+                await run_in_threadpool(_discard_all)
+
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Database error while creating documents: {str(e)}"
@@ -123,6 +237,7 @@ class DocumentService:
         *,
         skip: int = 0,
         limit: int = DEFAULT_PAGE_SIZE,
+        after_id: Optional[str] = None,
         label: Optional[str] = None,
         index_status: Optional[IndexStatus] = None,
     ) -> Sequence[Document]:
@@ -130,8 +245,12 @@ class DocumentService:
 
         Args:
             project_id: Project ID
-            skip: Number of documents to skip (must be >= 0)
+            skip: Number of documents to skip (must be >= 0); ignored when
+                after_id is given
             limit: Maximum number of documents to return (1-1000)
+            after_id: Keyset cursor; return documents with id > after_id.
+                Each page is then a bounded index range scan (O(limit))
+                instead of scanning and discarding skip rows
             label: Filter by label
             index_status: Filter by index status
 
@@ -161,20 +280,26 @@ class DocumentService:
             )
 
         try:
-            # Build query
-            query = select(DocumentModel).where(DocumentModel.project_id == project_id)
-
-            # Apply filters
+            # Look up the pre-built statement for this predicate combination
+            # and bind parameters only; the statement is ordered by id so
+            # the composite (project_id, index_status, id) index serves both
+            # the filter and the pagination (keyset when a cursor is given,
+            # OFFSET otherwise for backward compatibility).
+            query = _LIST_STMT_CACHE[
+                (label is not None, index_status is not None, after_id is not None)
+            ]
+            params = {"pid": project_id, "limit": limit}
             if label is not None:
-                query = query.where(DocumentModel.label == label)
+                params["label"] = label
             if index_status is not None:
-                query = query.where(DocumentModel.index_status == index_status)
-
-            # Apply pagination
-            query = query.offset(skip).limit(limit)
+                params["status"] = index_status
+            if after_id is not None:
+                params["after_id"] = after_id
+            else:
+                params["skip"] = skip
 
             # Execute query
-            result = await self.db.execute(query)
+            result = await self.db.execute(query, params)
             documents = result.scalars().all()
 
             return [self._convert_to_pydantic(doc) for doc in documents]
@@ -184,6 +309,140 @@ class DocumentService:
                 detail=f"Database error while fetching documents: {str(e)}"
             ) from e
 
+    @staticmethod
+    def _prediction_predicate(prediction_id: str) -> ColumnElement[bool]:
+        """EXISTS predicate scoping documents to one prediction row."""
+        return exists().where(
+            Prediction.document_id == DocumentModel.id,
+            Prediction.id == prediction_id,
+        )
+
+    async def resolve_skip_cursor(
+        self,
+        project_id: str,
+        *,
+        skip: int,
+        label: Optional[str] = None,
+        index_status: Optional[IndexStatus] = None,
+        prediction_id: Optional[str] = None,
+    ) -> Optional[str]:
+        """Translate an OFFSET into a keyset cursor with an id-only probe.
+
+        Args:
+            project_id: Project ID
+            skip: Number of documents the caller wants to skip (> 0)
+            label: Filter by label
+            index_status: Filter by index status
+            prediction_id: Only documents carrying this prediction
+
+        Returns:
+            The id of the skip-th matching document, or None when fewer
+            than skip documents match (the page is empty)
+        """
+        query = select(DocumentModel.id).where(DocumentModel.project_id == project_id)
+
+        if label is not None:
+            query = query.where(DocumentModel.label == label)
+        if index_status is not None:
+            query = query.where(DocumentModel.index_status == index_status)
+        if prediction_id is not None:
+            query = query.where(self._prediction_predicate(prediction_id))
+
+        query = query.order_by(DocumentModel.id).offset(skip - 1).limit(1)
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def stream_multi(
+        self,
+        project_id: str,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after_id: Optional[str] = None,
+        label: Optional[str] = None,
+        index_status: Optional[IndexStatus] = None,
+        prediction_id: Optional[str] = None,
+    ) -> AsyncIterator[Document]:
+        """Stream documents one row at a time.
+
+        Unlike get_multi, rows are fetched from a server-side cursor and
+        yielded as they arrive, so memory stays bounded to one row (plus
+        the driver's fetch buffer) regardless of limit.
+
+        Args:
+            project_id: Project ID
+            limit: Maximum number of documents to return (1-1000)
+            after_id: Keyset cursor; return documents with id > after_id
+            label: Filter by label
+            index_status: Filter by index status
+            prediction_id: Only documents carrying this prediction
+
+        Yields:
+            Documents matching the criteria, in id order
+        """
+        query = select(DocumentModel).where(DocumentModel.project_id == project_id)
+
+        if label is not None:
+            query = query.where(DocumentModel.label == label)
+        if index_status is not None:
+            query = query.where(DocumentModel.index_status == index_status)
+        if after_id is not None:
+            query = query.where(DocumentModel.id > after_id)
+        if prediction_id is not None:
+            query = query.where(self._prediction_predicate(prediction_id))
+
+        query = (
+            query.order_by(DocumentModel.id)
+            .limit(limit)
+            .execution_options(yield_per=100)
+        )
+
+        result = await self.db.stream(query)
+        async for doc in result.scalars():
+            yield self._convert_to_pydantic(doc)
+
+    async def get_latest_predicted(
+        self,
+        project_id: str,
+        *,
+        skip: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> List[Document]:
+        """Get documents carrying predictions, most recently updated first.
+
+        Args:
+            project_id: Project ID
+            skip: Number of documents to skip
+            limit: Maximum number of documents to return
+
+        Returns:
+            List of documents that have at least one prediction, ordered
+            by updated_at descending (id as tiebreaker)
+
+        Raises:
+            HTTPException: If there's a database error
+        """
+        try:
+            query = (
+                select(DocumentModel)
+                .where(
+                    DocumentModel.project_id == project_id,
+                    exists().where(Prediction.document_id == DocumentModel.id),
+                )
+                .order_by(DocumentModel.updated_at.desc(), DocumentModel.id)
+                .offset(skip)
+                .limit(limit)
+            )
+            result = await self.db.execute(query)
+            return [
+                self._convert_to_pydantic(doc)
+                for doc in result.scalars().all()
+            ]
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error while fetching documents: {str(e)}"
+            ) from e
+
     async def count(
         self,
         project_id: str,
@@ -227,6 +486,83 @@ class DocumentService:
                 detail=f"Database error while counting documents: {str(e)}"
             ) from e
 
+    async def count_by_status(self, project_id: str) -> Optional[dict]:
+        """Count a project's documents grouped by index status.
+
+        Outer-joins the grouped counts onto the project row so project
+        existence and all status buckets come back in one round trip:
+        returns None when the project does not exist, and an empty dict
+        when it exists but has no documents.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Mapping of IndexStatus to document count, or None if the
+            project does not exist
+
+        Raises:
+            HTTPException: If there's a database error
+        """
+        try:
+            query = (
+                select(DocumentModel.index_status, func.count(DocumentModel.id))
+                .select_from(Project)
+                .outerjoin(
+                    DocumentModel, DocumentModel.project_id == Project.id
+                )
+                .where(Project.id == project_id)
+                .group_by(DocumentModel.index_status)
+            )
+            result = await self.db.execute(query)
+            rows = result.all()
+            if not rows:
+                return None
+            return {row[0]: row[1] for row in rows if row[0] is not None}
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error while counting documents: {str(e)}"
+            ) from e
+
+    async def reset_index_status(self, project_id: str) -> int:
+        """Mark all documents in a project as pending for re-indexing.
+
+        A single bulk UPDATE replaces loading every document into the
+        session and flushing one UPDATE per row; rows already pending are
+        skipped so no dead tuples are produced for them.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Number of documents marked pending
+
+        Raises:
+            HTTPException: If there's a database error
+        """
+        try:
+            result = await self.db.execute(
+                update(DocumentModel)
+                .where(DocumentModel.project_id == project_id)
+                .where(DocumentModel.index_status != IndexStatus.PENDING)
+                .values(index_status=IndexStatus.PENDING)
+            )
+            await self.db.commit()
+            return result.rowcount
+        except SQLAlchemyError as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Database error while resetting index status: {str(e)}"
+            ) from e
+
+    async def exists(self, document_id: str) -> bool:
+        """Check whether a document exists without fetching the row."""
+        result = await self.db.execute(
+            select(exists().where(DocumentModel.id == document_id))
+        )
+        return bool(result.scalar())
+
     async def get_by_id(self, document_id: str) -> Optional[Document]:
         """Get document by ID.
 
@@ -258,6 +594,59 @@ class DocumentService:
             'metadata': doc.doc_metadata  # Map doc_metadata to metadata for Pydantic
         })
 
+    async def existing_ids(
+        self, project_id: str, document_ids: List[str]
+    ) -> set:
+        """Get the subset of document IDs that exist in a project.
+
+        Projects only the id column, so batch existence checks over up to
+        1000 ids skip row payloads and ORM hydration entirely.
+
+        Args:
+            project_id: Project ID
+            document_ids: Document IDs to check
+
+        Returns:
+            Set of IDs present in the project
+        """
+        if not document_ids:
+            return set()
+
+        query = (
+            select(DocumentModel.id)
+            .where(DocumentModel.project_id == project_id)
+            .where(_id_in_array(document_ids))
+        )
+        result = await self.db.execute(query)
+        return set(result.scalars().all())
+
+    async def count_by_ids(
+        self, project_id: str, document_ids: List[str]
+    ) -> int:
+        """Count how many of the given IDs exist in a project.
+
+        Returns a single integer, so batch existence checks move no id
+        payload at all — the primary-key index answers the whole query.
+
+        Args:
+            project_id: Project ID
+            document_ids: Document IDs to check
+
+        Returns:
+            Number of IDs present in the project
+        """
+        if not document_ids:
+            return 0
+
+        query = (
+            select(func.count())
+            .select_from(DocumentModel)
+            .where(DocumentModel.project_id == project_id)
+            .where(_id_in_array(document_ids))
+        )
+        result = await self.db.execute(query)
+        return int(result.scalar_one())
+
     async def get_multi_by_ids(self, project_id: str, document_ids: List[str]) -> Sequence[Document]:
         """Get multiple documents by their IDs.
 
@@ -271,14 +660,14 @@ class DocumentService:
         query = (
             select(DocumentModel)
             .where(DocumentModel.project_id == project_id)
-            .where(DocumentModel.id.in_(document_ids))
+            .where(_id_in_array(document_ids))
         )
         result = await self.db.execute(query)
         documents = result.scalars().all()
 
         return [self._convert_to_pydantic(doc) for doc in documents]
 
-    async def delete_multi(self, project_id: str, document_ids: List[str]) -> None:
+    async def delete_multi(self, project_id: str, document_ids: List[str]) -> int:
         """Delete multiple documents.
 
         Args:
@@ -286,25 +675,35 @@ class DocumentService:
             document_ids: IDs of documents to delete
 
         Returns:
-            None
+            Number of documents deleted
 
         Raises:
             HTTPException: If there's a database error during deletion
         """
         try:
-            # Delete documents
-            query = (
-                select(DocumentModel)
+            # One DELETE ... RETURNING id round trip instead of a SELECT
+            # followed by per-row ORM deletes
+            result = await self.db.execute(
+                delete(DocumentModel)
                 .where(DocumentModel.project_id == project_id)
-                .where(DocumentModel.id.in_(document_ids))
+                .where(_id_in_array(document_ids))
+                .returning(DocumentModel.id)
             )
-            result = await self.db.execute(query)
-            documents = result.scalars().all()
+            deleted_ids = result.scalars().all()
+            await self.db.commit()
 
-            for doc in documents:
-                await self.db.delete(doc)
+            # The bulk DELETE bypasses the ORM before_delete hook, so
+            # remove the stored content explicitly. The unlinks are
+            # blocking file IO; run the whole batch in one worker-thread
+            # hop instead of blocking the event loop per document.
+            if deleted_ids:
+                def _remove_all() -> None:
+                    for doc_id in deleted_ids:
+                        document_storage.delete_document(project_id, doc_id)
 
-            await self.db.commit()
+                await run_in_threadpool(_remove_all)
+
+            return len(deleted_ids)
         except SQLAlchemyError as e:
             await self.db.rollback()
             raise HTTPException(
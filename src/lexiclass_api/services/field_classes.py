@@ -1,17 +1,39 @@
 """FieldClass service layer."""
 
 import logging
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.cache import TTLCache
 from ..models.field_class import FieldClass
 from ..schemas.field_class import FieldClassCreate, FieldClassUpdate
 
 logger = logging.getLogger(__name__)
 
+# Class rows change rarely but are looked up on every label mutation; a
+# short TTL bounds staleness while mutations invalidate eagerly. The
+# cache holds plain column snapshots, never mapped instances: a live ORM
+# object is tied to the session that loaded it and must not be handed to
+# another request's session.
+_class_cache = TTLCache(ttl=30.0, maxsize=4096)
+
+
+def _to_cache(field_class: Optional[FieldClass]) -> Optional[Dict[str, Any]]:
+    """Snapshot a class's column values for cross-request reuse."""
+    if field_class is None:
+        return None
+    return field_class.dict()
+
+
+def _from_cache(data: Dict[str, Any]) -> FieldClass:
+    """Rebuild a detached, read-only instance from cached column values."""
+    return FieldClass(**data)
+
 
 class FieldClassService:
     """Service for field class operations."""
@@ -31,6 +53,7 @@ class FieldClassService:
         self.db.add(db_obj)
         await self.db.commit()
         await self.db.refresh(db_obj)
+        _class_cache.store(class_id, _to_cache(db_obj))
 
         logger.info(
             "Created new field class",
@@ -43,10 +66,40 @@ class FieldClassService:
         return db_obj
 
     async def get(self, class_id: str) -> Optional[FieldClass]:
-        """Get field class by ID."""
+        """Get field class by ID.
+
+        Results are served from a short in-process TTL cache; mutations
+        through this service invalidate the cached entry. Cache hits
+        return a detached reconstruction — fine for reads, but mutations
+        must load their own row.
+        """
+        cached = _class_cache.get(class_id)
+        if cached is not TTLCache.MISSING:
+            return _from_cache(cached) if cached is not None else None
+
         result = await self.db.execute(
             select(FieldClass).where(FieldClass.id == class_id)
         )
+        field_class = result.scalar_one_or_none()
+        _class_cache.store(class_id, _to_cache(field_class))
+        return field_class
+
+    async def get_updated_at(self, class_id: str) -> Optional[datetime]:
+        """Get a class's updated_at timestamp without fetching the row."""
+        result = await self.db.execute(
+            select(FieldClass.updated_at).where(FieldClass.id == class_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_field_id(self, class_id: str) -> Optional[str]:
+        """Get a class's field_id without fetching the full row.
+
+        Lets callers distinguish a missing class from one that belongs
+        to another field in a single narrow query.
+        """
+        result = await self.db.execute(
+            select(FieldClass.field_id).where(FieldClass.id == class_id)
+        )
         return result.scalar_one_or_none()
 
     async def get_by_field(
@@ -66,35 +119,136 @@ class FieldClassService:
         )
         return result.scalars().all()
 
+    async def get_by_field_rows(
+        self,
+        field_id: str,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Get a keyset page of classes by field ID as plain column dicts.
+
+        Projects columns directly instead of hydrating ORM rows, so list
+        endpoints can serialize the dicts without model validation. Pages
+        are ordered by id and resumed via after_id, keeping page cost
+        constant regardless of depth.
+        """
+        query = (
+            select(
+                FieldClass.id,
+                FieldClass.field_id,
+                FieldClass.name,
+                FieldClass.created_at,
+                FieldClass.updated_at,
+            )
+            .where(FieldClass.field_id == field_id)
+            .order_by(FieldClass.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(FieldClass.id > after_id)
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
     async def update(
         self,
         db_obj: FieldClass,
         obj_in: FieldClassUpdate,
     ) -> FieldClass:
-        """Update field class."""
+        """Update field class.
+
+        ``db_obj`` may be a detached cache reconstruction from get(), so
+        a fresh mapped instance is loaded for the mutation instead of
+        re-attaching it to this session.
+        """
         update_data = obj_in.model_dump(exclude_unset=True)
 
+        field_class = await self.db.get(FieldClass, db_obj.id)
+        if field_class is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Field class not found",
+            )
+
         for field, value in update_data.items():
-            setattr(db_obj, field, value)
+            setattr(field_class, field, value)
 
-        self.db.add(db_obj)
         await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.refresh(field_class)
+        _class_cache.invalidate(field_class.id)
 
         logger.info(
             "Updated field class",
             extra={
-                "class_id": db_obj.id,
+                "class_id": field_class.id,
+                "updated_fields": list(update_data.keys()),
+            },
+        )
+        return field_class
+
+    async def update_by_id(
+        self,
+        class_id: str,
+        obj_in: FieldClassUpdate,
+    ) -> Optional[FieldClass]:
+        """Update field class by ID.
+
+        Fuses the existence check and the mutation into a single
+        UPDATE ... RETURNING round trip; returns None if no class matched.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get(class_id)
+
+        result = await self.db.execute(
+            update(FieldClass)
+            .where(FieldClass.id == class_id)
+            .values(**update_data)
+            .returning(FieldClass)
+        )
+        db_obj = result.scalar_one_or_none()
+        await self.db.commit()
+        _class_cache.invalidate(class_id)
+        if db_obj is None:
+            return None
+
+        logger.info(
+            "Updated field class",
+            extra={
+                "class_id": class_id,
                 "updated_fields": list(update_data.keys()),
             },
         )
         return db_obj
 
+    async def delete_by_id(self, class_id: str) -> bool:
+        """Delete field class by ID with a single DELETE ... RETURNING.
+
+        Returns True if a class was deleted, False if none matched.
+        """
+        result = await self.db.execute(
+            delete(FieldClass)
+            .where(FieldClass.id == class_id)
+            .returning(FieldClass.id)
+        )
+        deleted_id = result.scalar_one_or_none()
+        await self.db.commit()
+        _class_cache.invalidate(class_id)
+        if deleted_id is None:
+            return False
+
+        logger.info(
+            "Deleted field class",
+            extra={"class_id": class_id},
+        )
+        return True
+
     async def delete(self, db_obj: FieldClass) -> None:
         """Delete field class."""
         class_id = db_obj.id
         await self.db.delete(db_obj)
         await self.db.commit()
+        _class_cache.invalidate(class_id)
 
         logger.info(
             "Deleted field class",
@@ -1,17 +1,40 @@
 """Field service layer."""
 
 import logging
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import delete, exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.cache import TTLCache
 from ..models.field import Field
 from ..schemas.field import FieldCreate, FieldUpdate
 
 logger = logging.getLogger(__name__)
 
+# Field rows change rarely but are looked up on nearly every class/label/
+# training call, mostly just to produce 404s; a short TTL bounds staleness
+# while mutations through this service invalidate eagerly. The cache holds
+# plain column snapshots, never mapped instances: a live ORM object is
+# tied to the session that loaded it and must not be handed to another
+# request's session.
+_field_cache = TTLCache(ttl=30.0, maxsize=4096)
+
+
+def _to_cache(field: Optional[Field]) -> Optional[Dict[str, Any]]:
+    """Snapshot a field's column values for cross-request reuse."""
+    if field is None:
+        return None
+    return field.dict()
+
+
+def _from_cache(data: Dict[str, Any]) -> Field:
+    """Rebuild a detached, read-only instance from cached column values."""
+    return Field(**data)
+
 
 class FieldService:
     """Service for field operations."""
@@ -32,6 +55,7 @@ class FieldService:
         self.db.add(db_obj)
         await self.db.commit()
         await self.db.refresh(db_obj)
+        _field_cache.store(field_id, _to_cache(db_obj))
 
         logger.info(
             "Created new field",
@@ -44,10 +68,43 @@ class FieldService:
         return db_obj
 
     async def get(self, field_id: str) -> Optional[Field]:
-        """Get field by ID."""
+        """Get field by ID.
+
+        Results are served from a short in-process TTL cache; mutations
+        through this service invalidate the cached entry. Cache hits
+        return a detached reconstruction — fine for reads, but mutations
+        must load their own row.
+        """
+        cached = _field_cache.get(field_id)
+        if cached is not TTLCache.MISSING:
+            return _from_cache(cached) if cached is not None else None
+
         result = await self.db.execute(
             select(Field).where(Field.id == field_id)
         )
+        field = result.scalar_one_or_none()
+        _field_cache.store(field_id, _to_cache(field))
+        return field
+
+    async def exists(self, field_id: str) -> bool:
+        """Check whether a field exists without fetching the row."""
+        result = await self.db.execute(
+            select(exists().where(Field.id == field_id))
+        )
+        return bool(result.scalar())
+
+    async def get_project_id(self, field_id: str) -> Optional[str]:
+        """Get a field's project_id without fetching the full row."""
+        result = await self.db.execute(
+            select(Field.project_id).where(Field.id == field_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_updated_at(self, field_id: str) -> Optional[datetime]:
+        """Get a field's updated_at timestamp without fetching the row."""
+        result = await self.db.execute(
+            select(Field.updated_at).where(Field.id == field_id)
+        )
         return result.scalar_one_or_none()
 
     async def get_by_project(
@@ -67,35 +124,135 @@ class FieldService:
         )
         return result.scalars().all()
 
+    async def get_by_project_rows(
+        self,
+        project_id: str,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Get a keyset page of fields by project ID as plain column dicts.
+
+        Projects columns directly instead of hydrating ORM rows, so list
+        endpoints can serialize the dicts without model validation. Pages
+        are ordered by id and resumed via after_id, keeping page cost
+        constant regardless of depth.
+        """
+        query = (
+            select(
+                Field.id,
+                Field.project_id,
+                Field.name,
+                Field.description,
+                Field.created_at,
+                Field.updated_at,
+            )
+            .where(Field.project_id == project_id)
+            .order_by(Field.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(Field.id > after_id)
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
     async def update(
         self,
         db_obj: Field,
         obj_in: FieldUpdate,
     ) -> Field:
-        """Update field."""
+        """Update field.
+
+        ``db_obj`` may be a detached cache reconstruction from get(), so
+        a fresh mapped instance is loaded for the mutation instead of
+        re-attaching it to this session.
+        """
         update_data = obj_in.model_dump(exclude_unset=True)
 
+        field_obj = await self.db.get(Field, db_obj.id)
+        if field_obj is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Field not found",
+            )
+
         for field, value in update_data.items():
-            setattr(db_obj, field, value)
+            setattr(field_obj, field, value)
 
-        self.db.add(db_obj)
         await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.refresh(field_obj)
+        _field_cache.invalidate(field_obj.id)
+
+        logger.info(
+            "Updated field",
+            extra={
+                "field_id": field_obj.id,
+                "updated_fields": list(update_data.keys()),
+            },
+        )
+        return field_obj
+
+    async def update_by_id(
+        self,
+        field_id: str,
+        obj_in: FieldUpdate,
+    ) -> Optional[Field]:
+        """Update field by ID.
+
+        Fuses the existence check and the mutation into a single
+        UPDATE ... RETURNING round trip; returns None if no field matched.
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get(field_id)
+
+        result = await self.db.execute(
+            update(Field)
+            .where(Field.id == field_id)
+            .values(**update_data)
+            .returning(Field)
+        )
+        db_obj = result.scalar_one_or_none()
+        await self.db.commit()
+        _field_cache.invalidate(field_id)
+        if db_obj is None:
+            return None
 
         logger.info(
             "Updated field",
             extra={
-                "field_id": db_obj.id,
+                "field_id": field_id,
                 "updated_fields": list(update_data.keys()),
             },
         )
         return db_obj
 
+    async def delete_by_id(self, field_id: str) -> bool:
+        """Delete field by ID with a single DELETE ... RETURNING.
+
+        Returns True if a field was deleted, False if none matched.
+        """
+        result = await self.db.execute(
+            delete(Field).where(Field.id == field_id).returning(Field.id)
+        )
+        deleted_id = result.scalar_one_or_none()
+        await self.db.commit()
+        _field_cache.invalidate(field_id)
+        if deleted_id is None:
+            return False
+
+        logger.info(
+            "Deleted field",
+            extra={"field_id": field_id},
+        )
+        return True
+
     async def delete(self, db_obj: Field) -> None:
         """Delete field."""
         field_id = db_obj.id
         await self.db.delete(db_obj)
         await self.db.commit()
+        _field_cache.invalidate(field_id)
 
         logger.info(
             "Deleted field",
@@ -1,12 +1,13 @@
 """Model service layer."""
 
 import logging
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple
 from uuid import uuid4
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..models.field import Field
 from ..models.model import Model, ModelStatus
 from ..schemas.model import ModelCreate, ModelUpdate
 
@@ -93,6 +94,31 @@ class ModelService:
         )
         return result.scalar_one_or_none()
 
+    async def resolve_field_model(
+        self, field_id: str
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Resolve a field's project and latest ready model in one query.
+
+        Returns (project_id, model_id), with model_id None when the field
+        exists but has no ready model, or None when the field itself does
+        not exist — letting callers distinguish both cases with a single
+        round trip.
+        """
+        latest_ready_id = (
+            select(Model.id)
+            .where(Model.field_id == Field.id)
+            .where(Model.status == ModelStatus.READY)
+            .order_by(Model.version.desc())
+            .limit(1)
+            .correlate(Field)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(Field.project_id, latest_ready_id).where(Field.id == field_id)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row is not None else None
+
     async def update(
         self,
         db_obj: Model,
@@ -1,7 +1,8 @@
 """Prediction service layer."""
 
 import logging
-from typing import Optional, Sequence
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
 from uuid import uuid4
 
 from sqlalchemy import select
@@ -91,6 +92,41 @@ class PredictionService:
         )
         return result.scalars().all()
 
+    async def get_by_document_rows(
+        self,
+        document_id: str,
+        *,
+        after_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[dict]:
+        """Get a keyset page of a document's predictions as column dicts.
+
+        Projects columns directly instead of hydrating ORM rows, so list
+        endpoints can serialize the dicts without model validation. Pages
+        are ordered by id and resumed via after_id, keeping page cost
+        constant regardless of depth.
+        """
+        query = (
+            select(
+                Prediction.id,
+                Prediction.document_id,
+                Prediction.field_id,
+                Prediction.model_id,
+                Prediction.class_id,
+                Prediction.confidence,
+                Prediction.pred_metadata,
+                Prediction.created_at,
+                Prediction.updated_at,
+            )
+            .where(Prediction.document_id == document_id)
+            .order_by(Prediction.id)
+            .limit(limit)
+        )
+        if after_id is not None:
+            query = query.where(Prediction.id > after_id)
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings()]
+
     async def get_by_document_and_field(
         self, document_id: str, field_id: str
     ) -> Optional[Prediction]:
@@ -102,6 +138,18 @@ class PredictionService:
         )
         return result.scalar_one_or_none()
 
+    async def get_version_by_document_and_field(
+        self, document_id: str, field_id: str
+    ) -> Optional[Tuple[str, datetime]]:
+        """Get a prediction's (model_id, updated_at) without the full row."""
+        result = await self.db.execute(
+            select(Prediction.model_id, Prediction.updated_at)
+            .where(Prediction.document_id == document_id)
+            .where(Prediction.field_id == field_id)
+        )
+        row = result.first()
+        return (row[0], row[1]) if row is not None else None
+
     async def get_by_field(
         self,
         field_id: str,
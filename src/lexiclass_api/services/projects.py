@@ -1,17 +1,50 @@
 """Project service layer."""
 
+import asyncio
 import logging
-from typing import Optional, Sequence
+import shutil
+from typing import Any, Dict, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import delete, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from ..core.cache import TTLCache
+from ..core.config import settings
+from ..core.project_cache import invalidate_project_cache
+from ..core.storage import document_storage
 from ..models.project import Project
 from ..schemas.project import ProjectCreate, ProjectUpdate
 
 logger = logging.getLogger(__name__)
 
+# Short-lived in-process cache for project lookups. Project rows are
+# effectively static between mutations, yet every documents/indexing/
+# training call re-fetches them; a few seconds of reuse plus coalescing
+# of concurrent in-flight lookups collapses those bursts into one query.
+#
+# The cache holds plain column snapshots, never mapped instances: a live
+# ORM object is tied to the session that loaded it, and handing it to
+# another request's session (e.g. via db.add) raises InvalidRequestError
+# under concurrency.
+_project_cache = TTLCache(ttl=5.0, maxsize=1024)
+_inflight: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+
+def _to_cache(project: Optional[Project]) -> Optional[Dict[str, Any]]:
+    """Snapshot a project's column values for cross-request reuse."""
+    if project is None:
+        return None
+    return project.dict()
+
+
+def _from_cache(data: Dict[str, Any]) -> Project:
+    """Rebuild a detached, read-only instance from cached column values."""
+    return Project(**data)
+
 
 class ProjectService:
     """Service for project operations."""
@@ -32,7 +65,8 @@ class ProjectService:
         self.db.add(db_obj)
         await self.db.commit()
         await self.db.refresh(db_obj)
-        
+        _project_cache.store(project_id, _to_cache(db_obj))
+
         logger.info(
             "Created new project",
             extra={
@@ -43,11 +77,55 @@ class ProjectService:
         return db_obj
 
     async def get(self, project_id: str) -> Optional[Project]:
-        """Get project by ID."""
+        """Get project by ID.
+
+        Results are reused for a few seconds and concurrent lookups for
+        the same id are coalesced into a single query; mutations through
+        this service invalidate the cached entry. Cache hits return a
+        detached reconstruction — fine for reads, but mutations must go
+        through update()/update_status(), which load a fresh row.
+        """
+        cached = _project_cache.get(project_id)
+        if cached is not TTLCache.MISSING:
+            return _from_cache(cached) if cached is not None else None
+
+        inflight = _inflight.get(project_id)
+        if inflight is not None:
+            data = await inflight
+            return _from_cache(data) if data is not None else None
+
+        future: "asyncio.Future[Optional[Dict[str, Any]]]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        _inflight[project_id] = future
+        try:
+            # No endpoint serializes project relationships, so none are
+            # eager-loaded; raiseload turns any accidental lazy load —
+            # which would mean implicit IO under asyncpg — into an error
+            # instead of a hidden N+1.
+            result = await self.db.execute(
+                select(Project)
+                .options(raiseload("*"))
+                .where(Project.id == project_id)
+            )
+            project = result.scalar_one_or_none()
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            _inflight.pop(project_id, None)
+
+        data = _to_cache(project)
+        future.set_result(data)
+        _project_cache.store(project_id, data)
+        return project
+
+    async def exists(self, project_id: str) -> bool:
+        """Check whether a project exists without fetching the row."""
         result = await self.db.execute(
-            select(Project).where(Project.id == project_id)
+            select(exists().where(Project.id == project_id))
         )
-        return result.scalar_one_or_none()
+        return bool(result.scalar())
 
     async def get_multi(
         self,
@@ -58,6 +136,7 @@ class ProjectService:
         """Get multiple projects."""
         result = await self.db.execute(
             select(Project)
+            .options(raiseload("*"))
             .offset(skip)
             .limit(limit)
             .order_by(Project.created_at.desc())
@@ -69,35 +148,87 @@ class ProjectService:
         db_obj: Project,
         obj_in: ProjectUpdate,
     ) -> Project:
-        """Update project."""
+        """Update project.
+
+        ``db_obj`` may be a detached cache reconstruction from get(), so
+        a fresh mapped instance is loaded for the mutation instead of
+        re-attaching it to this session.
+        """
         update_data = obj_in.model_dump(exclude_unset=True)
-        
+
+        project = await self.db.get(
+            Project, db_obj.id, options=[raiseload("*")]
+        )
+        if project is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Project not found",
+            )
+
         for field, value in update_data.items():
-            setattr(db_obj, field, value)
+            setattr(project, field, value)
 
-        self.db.add(db_obj)
         await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self.db.refresh(project)
+        _project_cache.invalidate(project.id)
+        await invalidate_project_cache(project.id)
 
         logger.info(
             "Updated project",
             extra={
-                "project_id": db_obj.id,
+                "project_id": project.id,
                 "updated_fields": list(update_data.keys()),
             },
         )
-        return db_obj
+        return project
 
     async def delete(self, db_obj: Project) -> None:
         """Delete project."""
         project_id = db_obj.id
         await self.db.delete(db_obj)
         await self.db.commit()
+        _project_cache.invalidate(project_id)
+        await invalidate_project_cache(project_id)
+
+        logger.info(
+            "Deleted project",
+            extra={"project_id": project_id},
+        )
+
+    async def delete_by_id(self, project_id: str) -> bool:
+        """Delete a project by id without loading the row.
+
+        Every child table declares ON DELETE CASCADE, so one
+        DELETE ... RETURNING round trip replaces the fetch-then-delete
+        pair and RETURNING reports whether anything matched.
+        """
+        result = await self.db.execute(
+            delete(Project)
+            .where(Project.id == project_id)
+            .returning(Project.id)
+        )
+        deleted = result.scalar_one_or_none()
+        await self.db.commit()
+        if deleted is None:
+            return False
+
+        _project_cache.invalidate(project_id)
+        await invalidate_project_cache(project_id)
+
+        # The DB-level cascade bypasses the ORM before_delete hook that
+        # removes stored document content, so drop the project's whole
+        # storage directory explicitly (blocking IO, hence threadpool)
+        storage_path = settings.get_project_storage_path(project_id)
+        await run_in_threadpool(
+            shutil.rmtree, storage_path, ignore_errors=True
+        )
+        document_storage.forget_project(project_id)
 
         logger.info(
             "Deleted project",
             extra={"project_id": project_id},
         )
+        return True
 
     async def update_status(
         self,
@@ -108,7 +239,11 @@ class ProjectService:
         model_status: Optional[str] = None,
     ) -> Optional[Project]:
         """Update project status."""
-        project = await self.get(project_id)
+        # Bypass the read cache: mutation needs an instance mapped in
+        # this session, not a detached reconstruction
+        project = await self.db.get(
+            Project, project_id, options=[raiseload("*")]
+        )
         if not project:
             return None
 
@@ -118,9 +253,10 @@ class ProjectService:
         if model_status is not None:
             project.model_status = model_status
 
-        self.db.add(project)
         await self.db.commit()
         await self.db.refresh(project)
+        _project_cache.invalidate(project_id)
+        await invalidate_project_cache(project_id)
 
         logger.info(
             "Updated project status",
@@ -55,6 +55,8 @@ class PredictionTask(Task):
     base=PredictionTask,
     bind=True,
     queue=QueueName.PREDICTION,
+    acks_late=True,
+    reject_on_worker_lost=True,
 )
 async def predict_documents(
     self,
@@ -136,6 +136,8 @@ async def _train_model_async(
     base=TrainingTask,
     bind=True,
     queue=QueueName.TRAINING,
+    acks_late=True,
+    reject_on_worker_lost=True,
 )
 def train_model(
     self,
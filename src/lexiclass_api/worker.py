@@ -1,9 +1,29 @@
 """Celery worker configuration."""
 
+import hashlib
+import json
+import time
+
+import orjson
+import redis
 from celery import Celery
+from celery.signals import task_failure, task_postrun, task_prerun
+from kombu.serialization import register
 
 from .core.config import settings
 
+# orjson encodes the large document_ids lists several times faster than
+# stdlib json and produces smaller payloads on the broker. Safe here
+# because this app is both producer and consumer of its own tasks; json
+# stays accepted for messages from older producers.
+register(
+    "orjson",
+    orjson.dumps,
+    orjson.loads,
+    content_type="application/x-orjson",
+    content_encoding="utf-8",
+)
+
 # Create Celery app
 celery_app = Celery(
     "lexiclass_api",
@@ -13,12 +33,118 @@ celery_app = Celery(
 
 # Configure Celery
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    accept_content=["orjson", "json"],
+    result_serializer="orjson",
     timezone="UTC",
     enable_utc=True,
+    # Long-running, DB/model-bound tasks: prefetch one job at a time so
+    # work spreads across workers instead of queueing behind a busy one,
+    # ack late so a crashed worker's job is redelivered, and recycle
+    # children to bound model-library memory growth. Launch workers with
+    # -Ofair (and -c $CELERY_WORKER_CONCURRENCY) to match.
+    worker_prefetch_multiplier=settings.CELERY_WORKER_PREFETCH_MULTIPLIER,
+    worker_concurrency=settings.CELERY_WORKER_CONCURRENCY,
+    worker_max_tasks_per_child=settings.CELERY_WORKER_MAX_TASKS_PER_CHILD,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
 )
 
 # Auto-discover tasks
 celery_app.autodiscover_tasks(['lexiclass_api.tasks'])
+
+# Secondary index mapping each project to its in-flight tasks, so the
+# API can answer "which tasks run for this project" with one Redis read
+# instead of a broadcast inspect across every worker. The handlers run
+# inside the worker process, hence the synchronous client.
+_index_redis = redis.Redis.from_url(str(settings.CELERY_RESULT_BACKEND))
+
+_PROJECT_TASKS_TTL = 86400
+
+
+def project_tasks_key(project_id: str) -> str:
+    """Redis hash holding the in-flight task ids for a project."""
+    return f"project_tasks:{project_id}"
+
+
+@task_prerun.connect
+def _register_project_task(task_id=None, task=None, kwargs=None, **_extra):
+    project_id = (kwargs or {}).get("project_id")
+    if not project_id:
+        return
+    key = project_tasks_key(project_id)
+    entry = {
+        "name": task.name if task is not None else None,
+        "started_at": time.time(),
+    }
+    _index_redis.hset(key, task_id, json.dumps(entry))
+    _index_redis.expire(key, _PROJECT_TASKS_TTL)
+
+
+@task_postrun.connect
+def _unregister_project_task(task_id=None, kwargs=None, **_extra):
+    project_id = (kwargs or {}).get("project_id")
+    if project_id:
+        _index_redis.hdel(project_tasks_key(project_id), task_id)
+
+
+@task_failure.connect
+def _unregister_failed_project_task(task_id=None, kwargs=None, **_extra):
+    # task_postrun also fires after failures, but not when the worker
+    # process dies mid-task; this keeps the index from leaking entries
+    project_id = (kwargs or {}).get("project_id")
+    if project_id:
+        _index_redis.hdel(project_tasks_key(project_id), task_id)
+
+
+# Idempotency keys guarding duplicate prediction submissions; the API
+# sets them on enqueue (see api/v1/prediction.py) and the worker clears
+# them when the task finishes, with the TTL as a crash backstop.
+PREDICT_IDEMPOTENCY_TTL = 300
+
+
+def predict_idempotency_key(project_id, document_ids) -> str:
+    """Redis key identifying one (project, document set) prediction job."""
+    digest = hashlib.blake2b(
+        f"{project_id}:{sorted(document_ids or [])}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f"predict_idem:{digest}"
+
+
+@task_postrun.connect
+def _clear_predict_idempotency(sender=None, kwargs=None, **_extra):
+    if not getattr(sender, "name", "").endswith(".predict_documents"):
+        return
+    kwargs = kwargs or {}
+    if "project_id" not in kwargs:
+        return
+    _index_redis.delete(
+        predict_idempotency_key(
+            kwargs["project_id"], kwargs.get("document_ids")
+        )
+    )
+
+
+def latest_predictions_tag_key(project_id: str) -> str:
+    """Redis set tagging the cached latest-prediction pages of a project.
+
+    KEYS/SCAN are off limits in request paths, so the API registers every
+    pred_latest:* cache key it writes in this set and invalidation just
+    deletes the set's members.
+    """
+    return f"pred_latest_tags:{project_id}"
+
+
+@task_postrun.connect
+def _invalidate_latest_predictions(sender=None, kwargs=None, **_extra):
+    if not getattr(sender, "name", "").endswith(".predict_documents"):
+        return
+    project_id = (kwargs or {}).get("project_id")
+    if not project_id:
+        return
+    tag_key = latest_predictions_tag_key(project_id)
+    cache_keys = _index_redis.smembers(tag_key)
+    if cache_keys:
+        _index_redis.delete(*cache_keys)
+    _index_redis.delete(tag_key)
@@ -0,0 +1,115 @@
+"""Request-level tests for prediction endpoints."""
+
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+
+from lexiclass_api.models import (
+    Document,
+    Field,
+    FieldClass,
+    Model,
+    ModelStatus,
+    Prediction,
+)
+
+
+class TestLatestPredictions:
+    """Tests for GET /projects/{project_id}/predict/latest."""
+
+    @pytest.mark.asyncio
+    async def test_latest_predictions_empty_project_returns_404(
+        self,
+        client: AsyncClient,
+        api_url: str,
+    ):
+        """A project with no predictions must 404, not 500.
+
+        Regression test: the endpoint used to call the document service
+        with keyword arguments it did not accept, so every cache-miss
+        request raised TypeError before reaching the 404 branch.
+        """
+        response = await client.post(
+            f"{api_url}/projects/",
+            json={"name": "Latest Predictions Test", "description": "empty"},
+        )
+        assert response.status_code == 201, response.text
+        project_id = response.json()["id"]
+
+        response = await client.get(
+            f"{api_url}/projects/{project_id}/predict/latest"
+        )
+        assert response.status_code == 404, response.text
+        assert response.json()["detail"] == "No predictions found"
+
+    @pytest.mark.asyncio
+    async def test_latest_predictions_returns_predicted_documents(
+        self,
+        client: AsyncClient,
+        api_url: str,
+        db_session,
+    ):
+        """A predicted document comes back as a 200 page.
+
+        Regression test: the route used to be registered after
+        GET /{project_id}/predict/{prediction_id}, so "latest" bound as
+        a prediction id and this request 404ed from the wrong handler —
+        only the latest-predictions handler can produce this page.
+        """
+        response = await client.post(
+            f"{api_url}/projects/",
+            json={"name": "Latest Predictions Data Test", "description": ""},
+        )
+        assert response.status_code == 201, response.text
+        project_id = response.json()["id"]
+
+        doc_id = str(uuid4())
+        field = Field(id=str(uuid4()), project_id=project_id, name="topic")
+        field_class = FieldClass(
+            id=str(uuid4()), field_id=field.id, name="sports"
+        )
+        model = Model(
+            id=str(uuid4()),
+            field_id=field.id,
+            version=1,
+            model_path="unused",
+            status=ModelStatus.READY,
+        )
+        document = Document(
+            id=doc_id,
+            project_id=project_id,
+            content_path="unused",
+            doc_metadata={},
+        )
+        prediction = Prediction(
+            id=str(uuid4()),
+            document_id=doc_id,
+            field_id=field.id,
+            model_id=model.id,
+            class_id=field_class.id,
+            confidence=0.9,
+        )
+        db_session.add_all([field, field_class, model, document, prediction])
+        await db_session.commit()
+
+        response = await client.get(
+            f"{api_url}/projects/{project_id}/predict/latest"
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert isinstance(body, list)
+        assert [doc["id"] for doc in body] == [doc_id]
+
+    @pytest.mark.asyncio
+    async def test_latest_predictions_unknown_project_returns_404(
+        self,
+        client: AsyncClient,
+        api_url: str,
+    ):
+        """An unknown project id must 404 with the project detail."""
+        response = await client.get(
+            f"{api_url}/projects/does-not-exist/predict/latest"
+        )
+        assert response.status_code == 404, response.text
+        assert response.json()["detail"] == "Project not found"
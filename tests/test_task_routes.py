@@ -0,0 +1,32 @@
+"""Request-level routing tests for task endpoints."""
+
+import pytest
+from httpx import AsyncClient
+
+
+class TestBatchTaskStatus:
+    """Tests for GET /tasks."""
+
+    @pytest.mark.asyncio
+    async def test_batch_status_route_is_reachable(
+        self,
+        client: AsyncClient,
+        api_url: str,
+    ):
+        """The batch endpoint must resolve, not hit a project route.
+
+        Regression test: the endpoint originally lived on the indexing
+        router under the /projects prefix, where GET /projects/tasks was
+        matched by GET /projects/{project_id} first and every request
+        got 404 "Project not found".
+        """
+        response = await client.get(
+            f"{api_url}/tasks",
+            params={"task_ids": ["no-such-task"]},
+        )
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert isinstance(body, list)
+        assert len(body) == 1
+        assert body[0]["task_id"] == "no-such-task"
+        assert body[0]["status"] == "PENDING"